@@ -17,7 +17,8 @@ provide stronger guarantees.
 
 **Multi-tenant isolation:**  All queries and exports are scoped by
 ``org_id``.  Entries belonging to organization A are never visible in
-queries or exports for organization B.
+queries or exports for organization B.  ``PerTenantAuditLog`` goes further
+and keeps a separate hash chain per organization.
 
 DISCLAIMER: This module supports governance and audit workflows only.
 It does not perform clinical assessment or store diagnostic information.
@@ -25,16 +26,38 @@ It does not perform clinical assessment or store diagnostic information.
 
 from __future__ import annotations
 
+import copy
 import enum
 import hashlib
 import json
 import re
+import threading
 import uuid
-from datetime import datetime, timezone
-from typing import Any, Optional
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional
 
 from pydantic import BaseModel, Field
 
+from acuitybridge.models import _utc_now
+
+
+# SHA-256 constructor used for all chain hashing.  CPython's ``hashlib``
+# delegates to OpenSSL, whose EVP layer dispatches at runtime to SHA-NI /
+# ARMv8 crypto extensions when the CPU supports them, so binding it once
+# here is all that is needed to pick up hardware acceleration.
+_sha256 = hashlib.sha256
+
+# Shared encoder for canonical serialization.  ``json.dumps`` builds a new
+# ``JSONEncoder`` on every call whenever non-default options are passed;
+# reusing one configured instance produces byte-identical output.
+_canonical_encoder = json.JSONEncoder(sort_keys=True, default=str)
+
+# Canonical-form encoder for plain string fields (the C-accelerated escaper
+# ``json`` itself uses with its default ``ensure_ascii=True``).
+_encode_str = json.encoder.encode_basestring_ascii
+
 
 # ---------------------------------------------------------------------------
 # Audit event types
@@ -95,7 +118,7 @@ class AuditEntry(BaseModel):
         description="Unique identifier for this audit entry (UUID).",
     )
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utc_now,
         description="UTC timestamp of the event.",
     )
     org_id: str = Field(
@@ -135,22 +158,26 @@ class AuditEntry(BaseModel):
 
         Uses sorted JSON serialization to ensure consistent ordering.
         """
-        data = {
-            "entry_id": self.entry_id,
-            "timestamp": self.timestamp.isoformat(),
-            "org_id": self.org_id,
-            "actor_id": self.actor_id,
-            "actor_role": self.actor_role,
-            "event_type": self.event_type.value,
-            "target_entity": self.target_entity,
-            "metadata": self.metadata,
-            "previous_hash": self.previous_hash,
-        }
-        return json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        # Top-level keys are fixed, so they are emitted in presorted order
+        # from a template rather than built into a dict and re-sorted; only
+        # the free-form metadata goes through the sorting encoder.  The
+        # output is byte-identical to ``json.dumps(..., sort_keys=True)``.
+        return "".join((
+            '{"actor_id": ', _encode_str(self.actor_id),
+            ', "actor_role": ', _encode_str(self.actor_role),
+            ', "entry_id": ', _encode_str(self.entry_id),
+            ', "event_type": ', _encode_str(self.event_type.value),
+            ', "metadata": ', _canonical_encoder.encode(self.metadata),
+            ', "org_id": ', _encode_str(self.org_id),
+            ', "previous_hash": ', _encode_str(self.previous_hash),
+            ', "target_entity": ', _encode_str(self.target_entity),
+            ', "timestamp": ', _encode_str(self.timestamp.isoformat()),
+            "}",
+        )).encode("utf-8")
 
     def compute_hash(self) -> str:
         """Compute the SHA-256 hash of this entry's canonical representation."""
-        return hashlib.sha256(self.canonical_bytes()).hexdigest()
+        return _sha256(self.canonical_bytes()).hexdigest()
 
 
 # ---------------------------------------------------------------------------
@@ -158,16 +185,69 @@ class AuditEntry(BaseModel):
 # ---------------------------------------------------------------------------
 
 # Patterns that might appear in metadata and should be redacted before export.
+# The email local part may only start where a run of local-part
+# characters starts (the lookbehind), so a long run of word characters
+# and dots is tried once as a whole instead of once per position, which
+# would be quadratic on e.g. "a.a.a.a...".  Neither part is length-capped:
+# over-long addresses are still redacted rather than passed through.
 _PHI_PATTERNS: dict[str, re.Pattern] = {
     "ssn": re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
     "dob": re.compile(r"\b\d{4}-\d{2}-\d{2}\b"),  # ISO date as potential DOB
     "phone": re.compile(r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b"),
-    "email": re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
+    "email": re.compile(
+        r"(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"
+    ),
+}
+
+# All value patterns fused into a single alternation so each string is
+# scanned once instead of once per pattern.  Each alternative is a named
+# group, so ``match.lastgroup`` identifies which pattern fired.  Matching
+# is leftmost-first: the earliest match in the string wins, and when two
+# patterns match at the same position the one listed first above is used.
+_PHI_SCANNER: re.Pattern = re.compile(
+    "|".join(f"(?P<{name}>{pattern.pattern})" for name, pattern in _PHI_PATTERNS.items())
+)
+# Every pattern above can only match text containing four consecutive
+# digits (SSN, DOB and phone all end or start with \d{4}) or an "@"
+# (email).  Screening for those first is far cheaper than the fused scan
+# and lets typical free text -- and reason strings like "(9.0)" -- skip it.
+_PHI_DIGIT_RUN: re.Pattern = re.compile(r"\d\d\d\d")
+_PHI_MARKERS: dict[str, str] = {
+    name: f"[REDACTED-{name.upper()}]" for name in _PHI_PATTERNS
 }
 
 # Keys that are likely to contain PII/PHI and should be fully redacted.
-_PHI_KEYS = {"name", "full_name", "first_name", "last_name", "dob", "date_of_birth",
-             "ssn", "social_security", "email", "phone", "address", "zip_code"}
+_PHI_KEYS = frozenset({"name", "full_name", "first_name", "last_name", "dob", "date_of_birth",
+                       "ssn", "social_security", "email", "phone", "address", "zip_code"})
+
+
+# Immutable metadata values that redaction can pass through as-is.
+_SCALAR_TYPES = (int, float, bool, type(None))
+
+
+def _phi_marker(match: re.Match) -> str:
+    """Return the redaction marker for whichever PHI pattern matched."""
+    return _PHI_MARKERS[match.lastgroup]
+
+
+def _may_contain_phi(metadata: dict[str, Any]) -> bool:
+    """Return True if redaction could change ``metadata``.
+
+    That requires a PHI key or a non-empty string value somewhere in the
+    (nested) dict.  Numeric/boolean-only metadata is returned as-is by
+    ``redact_phi_from_metadata()``, so callers can skip it entirely.
+    """
+    stack = [metadata]
+    while stack:
+        for key, value in stack.pop().items():
+            if (key if key.islower() else key.lower()) in _PHI_KEYS:
+                return True
+            if isinstance(value, str):
+                if value:
+                    return True
+            elif isinstance(value, dict):
+                stack.append(value)
+    return False
 
 
 def redact_phi_from_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
@@ -183,26 +263,101 @@ def redact_phi_from_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
     Returns:
         A new dictionary with PHI-matching fields redacted.
     """
-    redacted = {}
-    for key, value in metadata.items():
-        if key.lower() in _PHI_KEYS:
-            redacted[key] = "[REDACTED]"
-        elif isinstance(value, str):
-            redacted_value = value
-            for pattern_name, pattern in _PHI_PATTERNS.items():
-                redacted_value = pattern.sub(f"[REDACTED-{pattern_name.upper()}]", redacted_value)
-            redacted[key] = redacted_value
-        elif isinstance(value, dict):
-            redacted[key] = redact_phi_from_metadata(value)
-        else:
-            redacted[key] = value
+    return _redact_metadata(metadata, {})
+
+
+def _redact_metadata(
+    metadata: dict[str, Any], redacted_strings: dict[str, str]
+) -> dict[str, Any]:
+    """Implementation of ``redact_phi_from_metadata()``.
+
+    ``redacted_strings`` memoizes scanner output per distinct string value;
+    exports share one memo across all entries, since event metadata repeats
+    the same notes and reasons many times.
+    """
+    redacted: dict[str, Any] = {}
+    # Iterative walk: each nested dict gets its (empty) output slot in place
+    # -- preserving key order -- and is filled when popped off the stack,
+    # so arbitrarily deep metadata costs no Python recursion.
+    stack = [(metadata, redacted)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            # Keys are almost always lowercase already; skip the copy if so.
+            if (key if key.islower() else key.lower()) in _PHI_KEYS:
+                target[key] = "[REDACTED]"
+            elif isinstance(value, str):
+                cleaned = redacted_strings.get(value)
+                if cleaned is None:
+                    if "@" in value or _PHI_DIGIT_RUN.search(value):
+                        cleaned = _PHI_SCANNER.sub(_phi_marker, value)
+                    else:
+                        cleaned = value
+                    redacted_strings[value] = cleaned
+                target[key] = cleaned
+            elif isinstance(value, dict):
+                nested: dict[str, Any] = {}
+                target[key] = nested
+                stack.append((value, nested))
+            elif isinstance(value, _SCALAR_TYPES):
+                target[key] = value
+            else:
+                # Lists, tuples and any other containers are copied so
+                # the output never shares mutable state with the input.
+                target[key] = copy.deepcopy(value)
     return redacted
 
 
+def _export_dict(
+    entry: AuditEntry, redacted_strings: dict[str, str]
+) -> dict[str, Any]:
+    """Build the export representation of ``entry`` with PHI redacted.
+
+    Reads the fields directly rather than going through ``model_dump()``.
+    Metadata is always rebuilt: either redacted by ``_redact_metadata()``,
+    which copies every container it passes through, or deep-copied when
+    there is nothing to redact.  Either way the export never aliases the
+    log.
+    ``redacted_strings`` is the export-wide memo (see ``_redact_metadata``).
+    """
+    metadata = entry.metadata
+    return {
+        "entry_id": entry.entry_id,
+        "timestamp": entry.timestamp.isoformat(),
+        "org_id": entry.org_id,
+        "actor_id": entry.actor_id,
+        "actor_role": entry.actor_role,
+        "event_type": entry.event_type,
+        "target_entity": entry.target_entity,
+        # Redaction only rebuilds what it might change; otherwise copy.
+        "metadata": (
+            _redact_metadata(metadata, redacted_strings)
+            if _may_contain_phi(metadata)
+            else copy.deepcopy(metadata)
+        ),
+        "previous_hash": entry.previous_hash,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Audit log
 # ---------------------------------------------------------------------------
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_us(timestamp: datetime) -> int:
+    """Return ``timestamp`` as integer microseconds since the UNIX epoch.
+
+    Exact at datetime's native resolution (no float rounding).  Naive
+    timestamps are taken to be UTC, matching the model's convention.
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
 class AuditLog:
     """Append-only, tamper-evident audit log with SHA-256 hash chaining.
 
@@ -229,6 +384,21 @@ class AuditLog:
     def __init__(self) -> None:
         self._entries: list[AuditEntry] = []
         self._hashes: list[str] = []  # parallel list of computed hashes
+        self._append_lock = threading.Lock()
+        self._verified_prefix = 0  # entries covered by the last valid walk
+        # Parallel filter columns, captured at append time, so query() can
+        # scan flat lists instead of walking attributes on every model.
+        self._event_types: list[AuditEventType] = []
+        self._timestamps_us: list[int] = []  # see _epoch_us()
+        self._actor_ids: list[str] = []
+        # Position indexes (ascending, i.e. insertion order) so a query only
+        # visits entries of its own organization.
+        self._by_org: dict[str, list[int]] = defaultdict(list)
+        self._by_org_event: dict[tuple[str, AuditEventType], list[int]] = defaultdict(list)
+        self._by_org_actor: dict[tuple[str, str], list[int]] = defaultdict(list)
+        # Per-org (timestamp_us, position) pairs sorted by time, so a time
+        # window is found by bisection instead of a scan of the org.
+        self._by_org_time: dict[str, list[tuple[int, int]]] = defaultdict(list)
 
     def append(self, entry: AuditEntry) -> AuditEntry:
         """Append a new entry to the audit log.
@@ -242,41 +412,109 @@ class AuditLog:
         Returns:
             The entry with ``previous_hash`` populated.
         """
+        # Each link depends on the previous digest, so appends are inherently
+        # sequential; the lock keeps concurrent producers from forking the
+        # chain off the same predecessor.  The hash is published before the
+        # entry so readers that size their view by ``_entries`` always find
+        # a matching witness.
+        with self._append_lock:
+            self._append_locked(entry)
+        return entry
+
+    def extend(self, entries: Iterable[AuditEntry]) -> list[AuditEntry]:
+        """Append several entries to the audit log in order.
+
+        Equivalent to calling :meth:`append` for each entry, but the whole
+        batch is linked under a single lock acquisition, so the entries
+        land contiguously in the chain.
+
+        Args:
+            entries: The audit entries to append, in chain order.
+
+        Returns:
+            The entries with ``previous_hash`` populated.
+        """
+        batch = list(entries)
+        with self._append_lock:
+            for entry in batch:
+                self._append_locked(entry)
+        return batch
+
+    def _append_locked(self, entry: AuditEntry) -> None:
+        """Link and store one entry.  Caller must hold ``_append_lock``."""
         if self._hashes:
+            # Reuse the stored digest object itself: each hex digest is
+            # held once and shared by ``_hashes`` and the next entry.
             entry.previous_hash = self._hashes[-1]
         else:
             entry.previous_hash = ""
 
-        self._entries.append(entry)
+        position = len(self._entries)
         self._hashes.append(entry.compute_hash())
-        return entry
+        self._entries.append(entry)
+        self._event_types.append(entry.event_type)
+        timestamp_us = _epoch_us(entry.timestamp)
+        self._timestamps_us.append(timestamp_us)
+        self._actor_ids.append(entry.actor_id)
+        org_times = self._by_org_time[entry.org_id]
+        key = (timestamp_us, position)
+        if not org_times or org_times[-1] <= key:
+            org_times.append(key)  # the usual case: entries arrive in time order
+        else:
+            insort(org_times, key)
+        self._by_org[entry.org_id].append(position)
+        self._by_org_event[(entry.org_id, entry.event_type)].append(position)
+        self._by_org_actor[(entry.org_id, entry.actor_id)].append(position)
 
-    def verify_chain(self) -> tuple[bool, Optional[int]]:
+    def verify_chain(self, incremental: bool = False) -> tuple[bool, Optional[int]]:
         """Walk the log and validate every hash link.
 
+        Args:
+            incremental: If True, only check entries appended since the
+                last successful verification (their links still anchor to
+                the recorded witness of the last verified entry).  This is
+                cheap for repeated checks on a growing log, but it does not
+                re-detect tampering with entries that were verified earlier;
+                the default full walk does.
+
         Returns:
             A tuple of ``(valid, broken_at)`` where ``valid`` is True if
             the entire chain is intact, and ``broken_at`` is the index of
             the first broken link (or None if valid).
         """
-        if not self._entries:
+        # Snapshot a consistent prefix; appends may continue concurrently.
+        total = len(self._entries)
+        start = min(self._verified_prefix, total) if incremental else 0
+        if start == total:
             return (True, None)
-
-        for i, entry in enumerate(self._entries):
-            # Verify previous_hash link
-            if i == 0:
-                if entry.previous_hash != "":
-                    return (False, 0)
-            else:
-                expected_prev_hash = self._entries[i - 1].compute_hash()
-                if entry.previous_hash != expected_prev_hash:
-                    return (False, i)
-
-            # Verify stored hash matches recomputation
-            recomputed = entry.compute_hash()
-            if self._hashes[i] != recomputed:
-                return (False, i)
-
+        entries = self._entries[start:total]
+        hashes = self._hashes[:total]
+
+        # Pass 1: link check.  Each entry's previous_hash must equal the
+        # witness recorded for the entry before it at append time (already
+        # in memory -- no rehash).  Comparing whole lists runs in C; the
+        # per-index scan only happens when a mismatch exists.
+        links = [entry.previous_hash for entry in entries]
+        expected_links = hashes[start - 1:total - 1] if start else [""] + hashes[:-1]
+        limit = len(entries)
+        if links != expected_links:
+            limit = next(
+                j for j, (link, expected) in enumerate(zip(links, expected_links))
+                if link != expected
+            )
+
+        # Pass 2: stored hash vs. recomputation, only up to the first broken
+        # link.  This is the only hash computed per entry; it is deliberately
+        # never cached on the entry, since a cached digest would mask later
+        # tampering.
+        for j in range(limit):
+            if hashes[start + j] != entries[j].compute_hash():
+                return (False, start + j)
+
+        if limit < len(entries):
+            return (False, start + limit)
+
+        self._verified_prefix = max(self._verified_prefix, total)
         return (True, None)
 
     def query(
@@ -300,22 +538,71 @@ class AuditLog:
             actor_id: Optional filter by actor.
 
         Returns:
-            List of matching ``AuditEntry`` objects (copies).
+            List of matching ``AuditEntry`` objects.  Each is a shallow
+            copy with its own deep copy of ``metadata`` (the only mutable
+            field), so editing a result never touches the log.
         """
-        results = []
-        for entry in self._entries:
-            if entry.org_id != org_id:
-                continue
-            if event_type is not None and entry.event_type != event_type:
+        entries = self._entries
+        return [
+            entries[i].model_copy(update={"metadata": copy.deepcopy(entries[i].metadata)})
+            for i in self._matching_positions(
+                org_id, event_type, time_start, time_end, actor_id
+            )
+        ]
+
+    def _matching_positions(
+        self,
+        org_id: str,
+        event_type: Optional[AuditEventType],
+        time_start: Optional[datetime],
+        time_end: Optional[datetime],
+        actor_id: Optional[str],
+    ) -> list[int]:
+        """Return log positions (in insertion order) matching the filters."""
+        event_types = self._event_types
+        timestamps = self._timestamps_us
+        start_us = None if time_start is None else _epoch_us(time_start)
+        end_us = None if time_end is None else _epoch_us(time_end)
+        actor_ids = self._actor_ids
+
+        # Start from the narrowest index that applies; every candidate
+        # already belongs to org_id, and the filter that selected the index
+        # needs no per-row re-check.  The remaining filters use the columns.
+        candidates = self._by_org.get(org_id, [])
+        check_event = event_type is not None
+        check_actor = actor_id is not None
+        if check_event:
+            by_event = self._by_org_event.get((org_id, event_type), [])
+            if len(by_event) <= len(candidates):
+                candidates, check_event = by_event, False
+        if check_actor:
+            by_actor = self._by_org_actor.get((org_id, actor_id), [])
+            if len(by_actor) < len(candidates):
+                candidates, check_actor = by_actor, False
+                check_event = event_type is not None
+        check_time = start_us is not None or end_us is not None
+        if check_time:
+            org_times = self._by_org_time.get(org_id, [])
+            lo = 0 if start_us is None else bisect_left(org_times, (start_us,))
+            hi = len(org_times) if end_us is None else bisect_left(org_times, (end_us + 1,))
+            if hi - lo < len(candidates):
+                candidates = sorted(position for _, position in org_times[lo:hi])
+                check_time = False
+                check_event = event_type is not None
+                check_actor = actor_id is not None
+
+        positions = []
+        for i in candidates:
+            if check_event and event_types[i] != event_type:
                 continue
-            if time_start is not None and entry.timestamp < time_start:
+            if check_time and start_us is not None and timestamps[i] < start_us:
                 continue
-            if time_end is not None and entry.timestamp > time_end:
+            if check_time and end_us is not None and timestamps[i] > end_us:
                 continue
-            if actor_id is not None and entry.actor_id != actor_id:
+            if check_actor and actor_ids[i] != actor_id:
                 continue
-            results.append(entry.model_copy(deep=True))
-        return results
+            positions.append(i)
+        return positions
 
     def export_for_review(
         self,
@@ -337,22 +624,20 @@ class AuditLog:
             A dictionary suitable for JSON serialization containing
             the entries, chain verification status, and export metadata.
         """
-        entries = self.query(org_id, time_start=time_start, time_end=time_end)
+        positions = self._matching_positions(org_id, None, time_start, time_end, None)
 
         # Apply PHI redaction
-        redacted_entries = []
-        for entry in entries:
-            entry_dict = entry.model_dump()
-            entry_dict["metadata"] = redact_phi_from_metadata(entry.metadata)
-            entry_dict["timestamp"] = entry.timestamp.isoformat()
-            redacted_entries.append(entry_dict)
+        redacted_strings: dict[str, str] = {}
+        redacted_entries = [
+            _export_dict(self._entries[i], redacted_strings) for i in positions
+        ]
 
         chain_valid, broken_at = self.verify_chain()
 
         return {
             "export_metadata": {
                 "org_id": org_id,
-                "exported_at": datetime.now(timezone.utc).isoformat(),
+                "exported_at": _utc_now().isoformat(),
                 "entry_count": len(redacted_entries),
                 "chain_integrity": "VALID" if chain_valid else f"BROKEN_AT_INDEX_{broken_at}",
                 "scope_note": (
@@ -364,6 +649,24 @@ class AuditLog:
             "entries": redacted_entries,
         }
 
+    def count_by_type(self, org_id: str) -> Counter[AuditEventType]:
+        """Count an organization's entries per event type.
+
+        Read off the (org, event type) position index, so no entries are
+        visited.
+
+        Args:
+            org_id: Organization to count.
+
+        Returns:
+            A ``Counter`` mapping each event type present to its count.
+        """
+        return Counter({
+            event_type: len(positions)
+            for (org, event_type), positions in list(self._by_org_event.items())
+            if org == org_id
+        })
+
     @property
     def length(self) -> int:
         """Return the number of entries in the log."""
@@ -371,3 +674,99 @@ class AuditLog:
 
     def __len__(self) -> int:
         return len(self._entries)
+
+
+class PerTenantAuditLog:
+    """Audit logs partitioned by organization, one hash chain per tenant.
+
+    Each organization gets its own :class:`AuditLog`, so appends, queries,
+    exports and chain verification only ever touch that tenant's entries.
+    Tampering in one tenant's chain does not affect another tenant's
+    export, and each chain can later be stored (e.g. on WORM storage)
+    independently.
+    """
+
+    def __init__(self) -> None:
+        self._logs: dict[str, AuditLog] = {}
+        self._logs_lock = threading.Lock()
+
+    def log_for(self, org_id: str) -> AuditLog:
+        """Return the audit log of ``org_id``, creating it on first use."""
+        log = self._logs.get(org_id)
+        if log is None:
+            with self._logs_lock:
+                log = self._logs.setdefault(org_id, AuditLog())
+        return log
+
+    def append(self, entry: AuditEntry) -> AuditEntry:
+        """Append an entry to its organization's chain.  See :meth:`AuditLog.append`."""
+        return self.log_for(entry.org_id).append(entry)
+
+    def extend(self, entries: Iterable[AuditEntry]) -> list[AuditEntry]:
+        """Append several entries, each to its organization's chain, in order.
+
+        Entries of the same organization land contiguously in its chain,
+        as with :meth:`AuditLog.extend`.
+        """
+        batch = list(entries)
+        by_org: dict[str, list[AuditEntry]] = {}
+        for entry in batch:
+            by_org.setdefault(entry.org_id, []).append(entry)
+        for org_id, org_entries in by_org.items():
+            self.log_for(org_id).extend(org_entries)
+        return batch
+
+    def verify_chain(
+        self, org_id: str, incremental: bool = False
+    ) -> tuple[bool, Optional[int]]:
+        """Verify one organization's chain.  See :meth:`AuditLog.verify_chain`.
+
+        ``broken_at`` is an index into that organization's chain.
+        """
+        log = self._logs.get(org_id)
+        if log is None:
+            return (True, None)
+        return log.verify_chain(incremental=incremental)
+
+    def query(
+        self,
+        org_id: str,
+        event_type: Optional[AuditEventType] = None,
+        time_start: Optional[datetime] = None,
+        time_end: Optional[datetime] = None,
+        actor_id: Optional[str] = None,
+    ) -> list[AuditEntry]:
+        """Query one organization's entries.  See :meth:`AuditLog.query`."""
+        log = self._logs.get(org_id)
+        if log is None:
+            return []
+        return log.query(org_id, event_type, time_start, time_end, actor_id)
+
+    def export_for_review(
+        self,
+        org_id: str,
+        time_start: Optional[datetime] = None,
+        time_end: Optional[datetime] = None,
+    ) -> dict[str, Any]:
+        """Export one organization's entries.  See :meth:`AuditLog.export_for_review`.
+
+        ``chain_integrity`` reflects that organization's chain only.
+        """
+        log = self._logs.get(org_id)
+        if log is None:
+            log = AuditLog()
+        return log.export_for_review(org_id, time_start, time_end)
+
+    def count_by_type(self, org_id: str) -> Counter[AuditEventType]:
+        """Count one organization's entries per event type.  See :meth:`AuditLog.count_by_type`."""
+        log = self._logs.get(org_id)
+        if log is None:
+            return Counter()
+        return log.count_by_type(org_id)
+
+    def list_orgs(self) -> list[str]:
+        """Return the organizations that have at least one entry, sorted."""
+        return sorted(self._logs)
+
+    def __len__(self) -> int:
+        return sum(len(log) for log in list(self._logs.values()))
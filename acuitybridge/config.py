@@ -29,20 +29,59 @@ criteria.
 from __future__ import annotations
 
 import copy
+import functools
+import re
+import threading
+from bisect import bisect_right, insort
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Literal, NamedTuple, Optional, Sequence
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_serializer, model_validator
 
 from acuitybridge.models import CrisisResourceTarget, RiskFlag
 
+# Prefer libyaml's C parser; PyYAML builds without it fall back to the
+# pure-Python loader.  Both are "safe" loaders with identical semantics.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_json_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """Generate a model's JSON schema once; schemas are fixed per class."""
+    return model.model_json_schema()
+
+
+class _SchemaCachedModel(BaseModel):
+    """Base for policy models whose JSON schema is served repeatedly."""
+
+    @classmethod
+    def json_schema(cls) -> dict[str, Any]:
+        """Return the model's JSON schema, generated once per class.
+
+        Returns:
+            A copy of the cached ``model_json_schema()`` output that the
+            caller may modify freely.
+        """
+        return copy.deepcopy(_cached_json_schema(cls))
+
 
 # ---------------------------------------------------------------------------
 # Escalation threshold model
 # ---------------------------------------------------------------------------
 
-class EscalationThresholds(BaseModel):
+# Flags in the order of EscalationThresholds.classify_distress() cut-offs.
+_DISTRESS_FLAGS = (RiskFlag.YELLOW, RiskFlag.ORANGE, RiskFlag.RED)
+
+# Elevated flags; the default set requiring human review.  A frozenset is
+# immutable, so every policy can share this one object as its default.
+_ELEVATED_FLAGS = frozenset(_DISTRESS_FLAGS)
+
+
+class EscalationThresholds(_SchemaCachedModel):
     """Policy-defined thresholds that determine when check-in signals are
     mapped to workflow risk flags.
 
@@ -103,32 +142,46 @@ class EscalationThresholds(BaseModel):
         description="Sleep quality at or below which it contributes to flag elevation.",
     )
 
-    @field_validator("orange_min_distress")
-    @classmethod
-    def orange_above_yellow(cls, v: float, info) -> float:
-        yellow = info.data.get("yellow_min_distress")
-        if yellow is not None and v < yellow:
+    def classify_distress(self, distress: float) -> tuple[RiskFlag, Optional[float]]:
+        """Bucket a distress score against the three distress thresholds.
+
+        The cut-offs are non-decreasing (enforced by the validator below),
+        so a single bisection finds the highest threshold reached.
+
+        Returns:
+            ``(flag, threshold)`` -- the highest distress flag reached and
+            the threshold value that was crossed, or ``(GREEN, None)``.
+        """
+        cutoffs = (self.yellow_min_distress, self.orange_min_distress, self.red_min_distress)
+        level = bisect_right(cutoffs, distress)
+        if level == 0:
+            return (RiskFlag.GREEN, None)
+        return (_DISTRESS_FLAGS[level - 1], cutoffs[level - 1])
+
+    @model_validator(mode="after")
+    def check_threshold_ordering(self) -> EscalationThresholds:
+        """Require yellow <= orange <= red, checked once per instance."""
+        if self.orange_min_distress < self.yellow_min_distress:
             raise ValueError(
-                f"orange_min_distress ({v}) must be >= yellow_min_distress ({yellow})"
+                f"orange_min_distress ({self.orange_min_distress}) must be "
+                f">= yellow_min_distress ({self.yellow_min_distress})"
             )
-        return v
-
-    @field_validator("red_min_distress")
-    @classmethod
-    def red_above_orange(cls, v: float, info) -> float:
-        orange = info.data.get("orange_min_distress")
-        if orange is not None and v < orange:
+        if self.red_min_distress < self.orange_min_distress:
             raise ValueError(
-                f"red_min_distress ({v}) must be >= orange_min_distress ({orange})"
+                f"red_min_distress ({self.red_min_distress}) must be "
+                f">= orange_min_distress ({self.orange_min_distress})"
             )
-        return v
+        return self
 
 
 # ---------------------------------------------------------------------------
 # Partner policy model
 # ---------------------------------------------------------------------------
 
-class PartnerPolicy(BaseModel):
+NotificationChannel = Literal["dashboard", "sms", "webhook", "email"]
+
+
+class PartnerPolicy(_SchemaCachedModel):
     """Complete workflow policy for a single partner organization.
 
     Each field is partner-configurable because deployment contexts vary
@@ -170,7 +223,7 @@ class PartnerPolicy(BaseModel):
             "partner's responsibility."
         ),
     )
-    consent_model: str = Field(
+    consent_model: Literal["opt_in", "opt_out"] = Field(
         default="opt_in",
         description=(
             "Consent approach: 'opt_in' (explicit consent required before "
@@ -190,13 +243,14 @@ class PartnerPolicy(BaseModel):
             "may need higher values."
         ),
     )
-    notification_channels: list[str] = Field(
-        default_factory=lambda: ["dashboard"],
+    notification_channels: tuple[NotificationChannel, ...] = Field(
+        default=("dashboard",),
         description=(
             "Channels for clinician escalation alerts: 'dashboard', 'sms', "
             "'webhook', 'email'.  Rural partners with limited connectivity "
             "may prefer SMS; large hospital systems may use webhook "
-            "integration with their existing alerting infrastructure."
+            "integration with their existing alerting infrastructure.  "
+            "Accepts any list; stored as an immutable tuple."
         ),
     )
     clinician_ack_sla_seconds: int = Field(
@@ -210,62 +264,155 @@ class PartnerPolicy(BaseModel):
             "longer windows.  Must be > 0."
         ),
     )
-    escalation_keyword_overrides: list[str] = Field(
-        default_factory=list,
+    escalation_keyword_overrides: tuple[str, ...] = Field(
+        default=(),
         description=(
             "Additional keywords that immediately trigger RED-level "
             "escalation when detected in participant input.  Partners may "
             "add population-specific terms (e.g., substance names for "
             "addiction recovery programs, specific self-harm terminology).  "
-            "These supplement -- not replace -- the default keyword list."
+            "These supplement -- not replace -- the default keyword list.  "
+            "Accepts any list; stored as an immutable tuple."
         ),
     )
-    human_review_required_flags: list[RiskFlag] = Field(
-        default_factory=lambda: [RiskFlag.YELLOW, RiskFlag.ORANGE, RiskFlag.RED],
+    human_review_required_flags: frozenset[RiskFlag] = Field(
+        default=_ELEVATED_FLAGS,
         description=(
             "Risk flag levels that require mandatory human review before "
             "any action.  GREEN is excluded by default (human review "
             "optional for GREEN).  Partners may add GREEN to require "
-            "human review for all flags."
+            "human review for all flags.  Accepts any list of flags; "
+            "stored as a frozenset so membership checks are O(1) and the "
+            "set cannot drift after validation.  Earlier releases stored a "
+            "list: callers must build a new set instead of calling "
+            "append() (e.g. ``flags | {RiskFlag.GREEN}``) and compare "
+            "against a set, not a list.  model_dump() returns the "
+            "frozenset; JSON output is a list in RiskFlag order."
         ),
     )
 
-    @field_validator("consent_model")
-    @classmethod
-    def validate_consent_model(cls, v: str) -> str:
-        allowed = {"opt_in", "opt_out"}
-        if v not in allowed:
-            raise ValueError(f"consent_model must be one of {allowed}, got '{v}'")
-        return v
+    @field_serializer("human_review_required_flags", when_used="json")
+    def _dump_review_flags(self, flags: frozenset[RiskFlag]) -> list[RiskFlag]:
+        """Emit the flags in RiskFlag order so JSON dumps are stable."""
+        return [flag for flag in RiskFlag if flag in flags]
+
+    @property
+    def keyword_set(self) -> frozenset[str]:
+        """``escalation_keyword_overrides`` as a frozenset for membership tests.
+
+        Built on each access: for the short keyword lists policies use,
+        that is cheaper than a cache lookup keyed by the tuple.  Callers
+        that test many check-ins against one policy should read it once.
+        """
+        return frozenset(self.escalation_keyword_overrides)
 
 
 # ---------------------------------------------------------------------------
 # Default policy
 # ---------------------------------------------------------------------------
 
-DEFAULT_POLICY = PartnerPolicy(
-    org_id="default",
-    org_name="Default Policy (Conservative Defaults)",
-    escalation_thresholds=EscalationThresholds(),
-    crisis_resource_targets=[],
-    consent_model="opt_in",
-    data_retention_days=90,
-    notification_channels=["dashboard"],
-    clinician_ack_sla_seconds=300,
-    escalation_keyword_overrides=[],
-)
-"""Built-in default policy with conservative, safe defaults.
-
-Uses the lowest reasonable thresholds and shortest SLAs to maximize
-safety when no partner-specific policy is configured.  Partners should
-always define their own policy for production use.
-"""
+# The default policy is validated on first access (PEP 562) rather than at
+# import, so callers that never fall back to it do not pay for it.
+_DEFAULT_POLICY: Optional[PartnerPolicy] = None
+_DEFAULT_POLICY_LOCK = threading.Lock()
+
+
+def _build_default_policy() -> PartnerPolicy:
+    """Built-in default policy with conservative, safe defaults.
+
+    Uses the lowest reasonable thresholds and shortest SLAs to maximize
+    safety when no partner-specific policy is configured.  Partners should
+    always define their own policy for production use.
+    """
+    return PartnerPolicy(
+        org_id="default",
+        org_name="Default Policy (Conservative Defaults)",
+        escalation_thresholds=EscalationThresholds(),
+        crisis_resource_targets=[],
+        consent_model="opt_in",
+        data_retention_days=90,
+        notification_channels=["dashboard"],
+        clinician_ack_sla_seconds=300,
+        escalation_keyword_overrides=[],
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``DEFAULT_POLICY`` lazily; it is built once and cached."""
+    global _DEFAULT_POLICY
+    if name == "DEFAULT_POLICY":
+        if _DEFAULT_POLICY is None:
+            with _DEFAULT_POLICY_LOCK:
+                if _DEFAULT_POLICY is None:
+                    _DEFAULT_POLICY = _build_default_policy()
+        return _DEFAULT_POLICY
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ---------------------------------------------------------------------------
+# Keyword matching
+# ---------------------------------------------------------------------------
+
+class _KeywordMatcher:
+    """Single-pass, case-insensitive whole-word matcher for keyword lists.
+
+    All keywords are compiled into one alternation (longest first, so
+    multi-word phrases win over their prefixes); scanning text is one
+    regex pass however many keywords are configured.
+    """
+
+    def __init__(self, pattern: re.Pattern, canonical: dict[str, str]) -> None:
+        self._pattern = pattern
+        self._canonical = canonical  # lowercased match -> configured keyword
+
+    @classmethod
+    def build(cls, keywords: Sequence[str]) -> Optional[_KeywordMatcher]:
+        """Compile ``keywords``; returns None when there is nothing to match."""
+        canonical: dict[str, str] = {}
+        for keyword in keywords:
+            if keyword.strip():
+                canonical.setdefault(keyword.lower(), keyword)
+        if not canonical:
+            return None
+        alternation = "|".join(
+            re.escape(k) for k in sorted(canonical, key=len, reverse=True)
+        )
+        pattern = re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+        return cls(pattern, canonical)
+
+    def find(self, text: str) -> list[str]:
+        """Return configured keywords found in ``text`` (first-seen order)."""
+        found: dict[str, None] = {}
+        for match in self._pattern.finditer(text):
+            keyword = self._canonical.get(match.group(0).lower())
+            if keyword is not None:
+                found.setdefault(keyword, None)
+        return list(found)
 
 
 # ---------------------------------------------------------------------------
 # Policy registry (multi-tenant)
 # ---------------------------------------------------------------------------
 
+class _RegisteredPolicy(NamedTuple):
+    """Immutable registry record: policy snapshot plus derived matchers."""
+
+    snapshot: dict
+    keyword_matcher: Optional[_KeywordMatcher]
+
+    @classmethod
+    def of(cls, policy: PartnerPolicy) -> _RegisteredPolicy:
+        snapshot = policy.model_dump()
+        # Validate the snapshot here, once, so a policy mutated into an
+        # invalid state after construction is rejected on registration and
+        # every later rebuild in PolicyRegistry.get() is known to succeed.
+        PartnerPolicy.model_validate(snapshot)
+        return cls(
+            snapshot=snapshot,
+            keyword_matcher=_KeywordMatcher.build(policy.escalation_keyword_overrides),
+        )
+
+
 class PolicyRegistry:
     """In-memory multi-tenant policy registry.
 
@@ -276,10 +423,25 @@ class PolicyRegistry:
     This class is the core of the multi-tenant pattern -- it ensures that
     each partner's workflow configuration is self-contained and cannot
     leak across organizational boundaries.
+
+    Policies are stored as plain-data snapshots (``model_dump()``),
+    validated once when registered or updated, and every ``get()``
+    rebuilds a fresh ``PartnerPolicy`` from the snapshot.  Callers
+    therefore never share mutable state with the registry, and
+    pydantic-core rebuilding the model is several times cheaper than
+    ``copy.deepcopy`` walking the object graph.
     """
 
     def __init__(self) -> None:
-        self._policies: dict[str, PartnerPolicy] = {}
+        # One immutable record per org, replaced wholesale on update, so a
+        # reader always sees a snapshot and its keyword matcher together
+        # and each lookup is a single dict access.  Writers serialize on
+        # the lock so check-then-store cannot race.
+        self._policies: dict[str, _RegisteredPolicy] = {}
+        self._write_lock = threading.Lock()
+        # Registered org_ids kept in sorted order as they are added; orgs
+        # are never removed and update() does not change the key set.
+        self._sorted_orgs: list[str] = []
 
     def register(self, policy: PartnerPolicy) -> None:
         """Register a new partner policy.
@@ -293,13 +455,18 @@ class PolicyRegistry:
 
         Raises:
             ValueError: If ``org_id`` is already registered.
+            pydantic.ValidationError: If the policy was mutated after
+                construction into a state that no longer validates (for
+                example, thresholds assigned out of order).
         """
-        if policy.org_id in self._policies:
-            raise ValueError(
-                f"Policy for org_id '{policy.org_id}' already registered. "
-                "Use update() to modify an existing policy."
-            )
-        self._policies[policy.org_id] = copy.deepcopy(policy)
+        record = _RegisteredPolicy.of(policy)
+        with self._write_lock:
+            if self._policies.setdefault(policy.org_id, record) is not record:
+                raise ValueError(
+                    f"Policy for org_id '{policy.org_id}' already registered. "
+                    "Use update() to modify an existing policy."
+                )
+            insort(self._sorted_orgs, policy.org_id)
 
     def get(self, org_id: str) -> PartnerPolicy:
         """Retrieve the policy for a specific organization.
@@ -308,14 +475,13 @@ class PolicyRegistry:
             org_id: The organization identifier.
 
         Returns:
-            A deep copy of the registered ``PartnerPolicy``.
+            A new, independent ``PartnerPolicy`` equal to the registered one.
 
         Raises:
-            KeyError: If no policy is registered for ``org_id``.
+            KeyError: If no policy is registered for ``org_id``.  Snapshots
+                are validated when stored, so rebuilding one never raises.
         """
-        if org_id not in self._policies:
-            raise KeyError(f"No policy registered for org_id '{org_id}'")
-        return copy.deepcopy(self._policies[org_id])
+        return PartnerPolicy.model_validate(self._record(org_id).snapshot)
 
     def update(self, policy: PartnerPolicy) -> None:
         """Update an existing partner policy.
@@ -328,12 +494,41 @@ class PolicyRegistry:
 
         Raises:
             KeyError: If no policy is registered for the given ``org_id``.
+            pydantic.ValidationError: If the policy was mutated after
+                construction into a state that no longer validates; the
+                registered policy is left unchanged.
         """
-        if policy.org_id not in self._policies:
-            raise KeyError(
-                f"Cannot update: no policy registered for org_id '{policy.org_id}'"
-            )
-        self._policies[policy.org_id] = copy.deepcopy(policy)
+        record = _RegisteredPolicy.of(policy)
+        with self._write_lock:
+            if policy.org_id not in self._policies:
+                raise KeyError(
+                    f"Cannot update: no policy registered for org_id '{policy.org_id}'"
+                )
+            self._policies[policy.org_id] = record
+
+    def detect_keywords(self, org_id: str, text: str) -> list[str]:
+        """Find the organization's escalation keywords in free text.
+
+        Matching is case-insensitive and whole-word, in a single pass over
+        ``text`` regardless of how many keywords the partner configured.
+        Whole-word, not substring, so a short keyword such as "harm" does
+        not fire on "pharmacy".  Only the partner's overrides are matched;
+        this package ships no default keyword list of its own.  The
+        result is suitable for ``CheckIn.keyword_flags``.
+
+        Args:
+            org_id: The organization whose keyword overrides apply.
+            text: Participant free-text input.
+
+        Returns:
+            Configured keywords found in ``text``, in order of first
+            appearance and without duplicates.
+
+        Raises:
+            KeyError: If no policy is registered for ``org_id``.
+        """
+        matcher = self._record(org_id).keyword_matcher
+        return matcher.find(text) if matcher is not None else []
 
     def list_orgs(self) -> list[str]:
         """Return a list of all registered organization IDs.
@@ -341,7 +536,14 @@ class PolicyRegistry:
         Returns:
             Sorted list of org_id strings.
         """
-        return sorted(self._policies.keys())
+        return list(self._sorted_orgs)
+
+    def _record(self, org_id: str) -> _RegisteredPolicy:
+        """Look up an org's record with a single dict probe."""
+        try:
+            return self._policies[org_id]
+        except KeyError:
+            raise KeyError(f"No policy registered for org_id '{org_id}'") from None
 
     def __len__(self) -> int:
         return len(self._policies)
@@ -375,6 +577,29 @@ def load_policies_from_yaml(path: str | Path) -> list[PartnerPolicy]:
     Returns:
         List of validated ``PartnerPolicy`` instances.
 
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the YAML structure is invalid.
+        pydantic.ValidationError: If any policy fails validation.
+    """
+    return list(iter_policies_from_yaml(path))
+
+
+def iter_policies_from_yaml(path: str | Path) -> Iterator[PartnerPolicy]:
+    """Lazily load partner policies from a YAML file.
+
+    Same format as :func:`load_policies_from_yaml`, except that the file
+    may also hold several ``---``-separated documents, each with its own
+    ``policies`` list.  Documents are parsed one at a time and each policy
+    is validated as it is yielded, so large catalogs can be registered
+    without holding every raw document in memory.
+
+    Args:
+        path: Path to the YAML file.
+
+    Yields:
+        Validated ``PartnerPolicy`` instances, in file order.
+
     Raises:
         FileNotFoundError: If the file does not exist.
         ValueError: If the YAML structure is invalid.
@@ -384,9 +609,22 @@ def load_policies_from_yaml(path: str | Path) -> list[PartnerPolicy]:
     if not path.exists():
         raise FileNotFoundError(f"Policy file not found: {path}")
 
-    with open(path, "r") as f:
-        raw = yaml.safe_load(f)
+    # Binary mode: the loader detects the encoding itself, skipping
+    # Python's text-decoding layer.
+    with open(path, "rb") as f:
+        found_document = False
+        for raw in yaml.load_all(f, Loader=_YamlLoader):
+            found_document = True
+            yield from _policies_in_document(raw)
 
+    if not found_document:
+        raise ValueError(
+            "YAML file must contain a top-level 'policies' key with a list of policy objects."
+        )
+
+
+def _policies_in_document(raw: Any) -> Iterator[PartnerPolicy]:
+    """Validate the ``policies`` list of one parsed YAML document."""
     if not isinstance(raw, dict) or "policies" not in raw:
         raise ValueError(
             "YAML file must contain a top-level 'policies' key with a list of policy objects."
@@ -396,26 +634,10 @@ def load_policies_from_yaml(path: str | Path) -> list[PartnerPolicy]:
     if not isinstance(policies_data, list):
         raise ValueError("'policies' must be a list of policy objects.")
 
-    policies: list[PartnerPolicy] = []
     for idx, entry in enumerate(policies_data):
         if not isinstance(entry, dict):
             raise ValueError(f"Policy entry at index {idx} must be a mapping.")
 
-        # Convert nested structures
-        if "escalation_thresholds" in entry and isinstance(
-            entry["escalation_thresholds"], dict
-        ):
-            entry["escalation_thresholds"] = EscalationThresholds(
-                **entry["escalation_thresholds"]
-            )
-        if "crisis_resource_targets" in entry and isinstance(
-            entry["crisis_resource_targets"], list
-        ):
-            entry["crisis_resource_targets"] = [
-                CrisisResourceTarget(**t) if isinstance(t, dict) else t
-                for t in entry["crisis_resource_targets"]
-            ]
-
-        policies.append(PartnerPolicy(**entry))
-
-    return policies
+        # Nested thresholds and crisis targets are validated in the same
+        # pydantic-core pass -- no need to pre-build the sub-models.
+        yield PartnerPolicy.model_validate(entry)
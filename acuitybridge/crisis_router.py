@@ -20,24 +20,30 @@ guarantee response times, or replace institutional crisis protocols.
 
 from __future__ import annotations
 
+from typing import NamedTuple
+
 from acuitybridge.audit import AuditEntry, AuditEventType, AuditLog
 from acuitybridge.config import PartnerPolicy
 from acuitybridge.escalation import EscalationCase
 from acuitybridge.models import CrisisResourceTarget
 
+_NO_TARGETS_METADATA = {
+    "note": "No crisis resource targets configured for this partner.",
+    "action": "No routing attempted. Partner must configure targets.",
+}
+
+_STUB_NOTE = (
+    "Interface stub invoked. Operational crisis protocols "
+    "are the partner's responsibility."
+)
+
 
-class CrisisRouteResult:
+class CrisisRouteResult(NamedTuple):
     """Result of a crisis resource routing attempt."""
 
-    def __init__(
-        self,
-        target: CrisisResourceTarget,
-        routed: bool,
-        message: str,
-    ) -> None:
-        self.target = target
-        self.routed = routed
-        self.message = message
+    target: CrisisResourceTarget
+    routed: bool
+    message: str
 
     def __repr__(self) -> str:
         return (
@@ -74,35 +80,35 @@ def route_to_crisis_resources(
             actor_role="SYSTEM",
             event_type=AuditEventType.CRISIS_INTERFACE_TRIGGERED,
             target_entity=case.case_id,
-            metadata={
-                "note": "No crisis resource targets configured for this partner.",
-                "action": "No routing attempted. Partner must configure targets.",
-            },
+            metadata=dict(_NO_TARGETS_METADATA),
         ))
         return results
 
+    # Only the metadata varies per target; the rest of each entry is fixed
+    # by the case, and the whole batch is chained in a single extend().
+    entry_fields = {
+        "org_id": case.org_id,
+        "actor_id": "SYSTEM",
+        "actor_role": "SYSTEM",
+        "event_type": AuditEventType.CRISIS_INTERFACE_TRIGGERED,
+        "target_entity": case.case_id,
+    }
+    entries: list[AuditEntry] = []
     for target in policy.crisis_resource_targets:
         result = _route_single_target(target)
         results.append(result)
-
-        audit_log.append(AuditEntry(
-            org_id=case.org_id,
-            actor_id="SYSTEM",
-            actor_role="SYSTEM",
-            event_type=AuditEventType.CRISIS_INTERFACE_TRIGGERED,
-            target_entity=case.case_id,
+        entries.append(AuditEntry(
+            **entry_fields,
             metadata={
                 "target_name": target.name,
                 "target_type": target.target_type,
                 "routed": result.routed,
                 "message": result.message,
-                "note": (
-                    "Interface stub invoked. Operational crisis protocols "
-                    "are the partner's responsibility."
-                ),
+                "note": _STUB_NOTE,
             },
         ))
 
+    audit_log.extend(entries)
     return results
 
 
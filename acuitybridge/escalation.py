@@ -38,32 +38,46 @@ decisions.  All escalation actions require human review and approval.
 
 from __future__ import annotations
 
+import functools
 import uuid
-from datetime import datetime, timezone
-from typing import Optional
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Optional
 
 from pydantic import BaseModel, Field
 
 from acuitybridge.audit import AuditEntry, AuditEventType, AuditLog
 from acuitybridge.config import PartnerPolicy
-from acuitybridge.models import EscalationState, Participant, RiskFlag
+from acuitybridge.models import EscalationState, Participant, RiskFlag, _utc_now
+
+
+@functools.lru_cache(maxsize=None)
+def _sla_window(seconds: int) -> timedelta:
+    """Acknowledgment SLA as a timedelta; partners use a handful of values."""
+    return timedelta(seconds=seconds)
 
 
 # ---------------------------------------------------------------------------
 # Valid state transitions
 # ---------------------------------------------------------------------------
 
-_VALID_TRANSITIONS: dict[EscalationState, set[EscalationState]] = {
-    EscalationState.DETECTED: {EscalationState.ALERT_SENT},
-    EscalationState.ALERT_SENT: {EscalationState.CLINICIAN_NOTIFIED},
-    EscalationState.CLINICIAN_NOTIFIED: {
+_VALID_TRANSITIONS: dict[EscalationState, frozenset[EscalationState]] = {
+    EscalationState.DETECTED: frozenset({EscalationState.ALERT_SENT}),
+    EscalationState.ALERT_SENT: frozenset({EscalationState.CLINICIAN_NOTIFIED}),
+    EscalationState.CLINICIAN_NOTIFIED: frozenset({
         EscalationState.ACKNOWLEDGED,
         EscalationState.TIMED_OUT,
-    },
-    EscalationState.ACKNOWLEDGED: {EscalationState.RESOLVED},
-    EscalationState.RESOLVED: set(),  # terminal state
-    EscalationState.TIMED_OUT: {EscalationState.CRISIS_INTERFACE_TRIGGERED},
-    EscalationState.CRISIS_INTERFACE_TRIGGERED: set(),  # terminal state
+    }),
+    EscalationState.ACKNOWLEDGED: frozenset({EscalationState.RESOLVED}),
+    EscalationState.RESOLVED: frozenset(),  # terminal state
+    EscalationState.TIMED_OUT: frozenset({EscalationState.CRISIS_INTERFACE_TRIGGERED}),
+    EscalationState.CRISIS_INTERFACE_TRIGGERED: frozenset(),  # terminal state
+}
+
+# Allowed target values per source state, pre-rendered for error messages.
+_ALLOWED_TARGET_VALUES: dict[EscalationState, list[str]] = {
+    source: sorted(target.value for target in targets)
+    for source, targets in _VALID_TRANSITIONS.items()
 }
 
 
@@ -94,9 +108,13 @@ class EscalationCase(BaseModel):
         ...,
         description="The workflow risk flag that triggered this escalation.",
     )
-    triggering_indicators: list[str] = Field(
-        default_factory=list,
-        description="List of indicators that triggered the escalation (e.g., keyword matches, threshold breaches).",
+    triggering_indicators: tuple[str, ...] = Field(
+        default=(),
+        description=(
+            "Indicators that triggered the escalation (e.g., keyword matches, "
+            "threshold breaches).  Fixed when the case is opened, so stored "
+            "as an immutable tuple."
+        ),
     )
     state: EscalationState = Field(
         default=EscalationState.DETECTED,
@@ -107,7 +125,7 @@ class EscalationCase(BaseModel):
         description="ID of the clinician assigned to review this case.",
     )
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utc_now,
         description="UTC timestamp when the case was opened.",
     )
     alert_sent_at: Optional[datetime] = Field(default=None)
@@ -126,6 +144,24 @@ class EscalationCase(BaseModel):
     )
 
 
+def _audit_entry(
+    event_type: AuditEventType,
+    case: EscalationCase,
+    actor_id: str,
+    actor_role: str = "SYSTEM",
+    metadata: dict | None = None,
+) -> AuditEntry:
+    """Build the audit entry for an action on ``case``."""
+    return AuditEntry(
+        org_id=case.org_id,
+        actor_id=actor_id,
+        actor_role=actor_role,
+        event_type=event_type,
+        target_entity=case.case_id,
+        metadata=metadata or {},
+    )
+
+
 # ---------------------------------------------------------------------------
 # Transition errors
 # ---------------------------------------------------------------------------
@@ -163,11 +199,26 @@ class EscalationOrchestrator:
     * ``check_sla_timeout()`` triggers crisis interface if SLA exceeded.
     * ``suspend_automated_interaction()`` blocks automated content.
     * Multi-tenant isolation: policy org_id must match case org_id.
+
+    Args:
+        audit_log: Log that receives every lifecycle event.
+        clock: Returns the current timezone-aware UTC time.  Used for case
+            lifecycle timestamps and SLA checks, so a fake clock can step
+            time deterministically.  Audit entries keep their own
+            wall-clock timestamps.
     """
 
-    def __init__(self, audit_log: AuditLog) -> None:
+    def __init__(
+        self,
+        audit_log: AuditLog,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
         self._audit_log = audit_log
+        self._clock = clock
         self._suspended_participants: set[str] = set()
+        # Cases awaiting clinician acknowledgment, by org then case_id --
+        # the only cases an SLA sweep needs to visit.
+        self._awaiting_ack: dict[str, dict[str, EscalationCase]] = defaultdict(dict)
 
     # -- helpers --
 
@@ -175,11 +226,12 @@ class EscalationOrchestrator:
         self, case: EscalationCase, target: EscalationState
     ) -> None:
         """Raise InvalidTransitionError if the transition is not allowed."""
-        allowed = _VALID_TRANSITIONS.get(case.state, set())
-        if target not in allowed:
+        # Every state has an entry, so this is a single lookup with no
+        # fallback set allocated per call.
+        if target not in _VALID_TRANSITIONS[case.state]:
             raise InvalidTransitionError(
                 f"Cannot transition from {case.state.value} to {target.value}. "
-                f"Allowed transitions: {[s.value for s in allowed]}"
+                f"Allowed transitions: {_ALLOWED_TARGET_VALUES[case.state]}"
             )
 
     def _validate_org_match(
@@ -201,14 +253,9 @@ class EscalationOrchestrator:
         metadata: dict | None = None,
     ) -> None:
         """Emit a structured audit event for a case action."""
-        self._audit_log.append(AuditEntry(
-            org_id=case.org_id,
-            actor_id=actor_id,
-            actor_role=actor_role,
-            event_type=event_type,
-            target_entity=case.case_id,
-            metadata=metadata or {},
-        ))
+        self._audit_log.append(
+            _audit_entry(event_type, case, actor_id, actor_role, metadata)
+        )
 
     # -- lifecycle operations --
 
@@ -254,21 +301,26 @@ class EscalationOrchestrator:
             flag_level=flag_level,
             triggering_indicators=indicators,
             state=EscalationState.DETECTED,
+            created_at=self._clock(),
         )
 
-        self._emit_audit(
-            event_type=AuditEventType.ESCALATION_OPENED,
-            case=case,
-            actor_id="SYSTEM",
+        opened = _audit_entry(
+            AuditEventType.ESCALATION_OPENED,
+            case,
+            "SYSTEM",
             metadata={
                 "flag_level": flag_level.value,
-                "indicators": indicators,
+                # A fresh list from the case's tuple, not the caller's list:
+                # later changes to the argument must not alter the chained
+                # audit record, and the audited shape stays a JSON list.
+                "indicators": list(case.triggering_indicators),
                 "participant_id": participant.participant_id,
             },
         )
 
-        # Automatically suspend automated interaction
-        self.suspend_automated_interaction(case)
+        # Automatically suspend automated interaction; the opening and the
+        # suspension are chained together in one append.
+        self._audit_log.extend((opened, self._suspend(case)))
 
         return case
 
@@ -286,7 +338,7 @@ class EscalationOrchestrator:
         """
         self._validate_transition(case, EscalationState.ALERT_SENT)
         case.state = EscalationState.ALERT_SENT
-        case.alert_sent_at = datetime.now(timezone.utc)
+        case.alert_sent_at = self._clock()
 
         self._emit_audit(
             event_type=AuditEventType.ESCALATION_OPENED,
@@ -313,7 +365,8 @@ class EscalationOrchestrator:
         self._validate_transition(case, EscalationState.CLINICIAN_NOTIFIED)
         case.state = EscalationState.CLINICIAN_NOTIFIED
         case.assigned_clinician_id = clinician_id
-        case.clinician_notified_at = datetime.now(timezone.utc)
+        case.clinician_notified_at = self._clock()
+        self._awaiting_ack[case.org_id][case.case_id] = case
 
         self._emit_audit(
             event_type=AuditEventType.CLINICIAN_NOTIFIED,
@@ -355,7 +408,8 @@ class EscalationOrchestrator:
             )
 
         case.state = EscalationState.ACKNOWLEDGED
-        case.acknowledged_at = datetime.now(timezone.utc)
+        case.acknowledged_at = self._clock()
+        self._awaiting_ack[case.org_id].pop(case.case_id, None)
 
         self._emit_audit(
             event_type=AuditEventType.ESCALATION_ACKNOWLEDGED,
@@ -404,22 +458,23 @@ class EscalationOrchestrator:
             )
 
         case.state = EscalationState.RESOLVED
-        case.resolved_at = datetime.now(timezone.utc)
+        case.resolved_at = self._clock()
         case.resolution_notes = resolution_notes
 
-        # Resume automated interaction
-        self.resume_automated_interaction(case)
-
-        self._emit_audit(
-            event_type=AuditEventType.ESCALATION_RESOLVED,
-            case=case,
-            actor_id=clinician_id,
-            actor_role="CLINICIAN",
-            metadata={
-                "new_state": EscalationState.RESOLVED.value,
-                "resolution_notes": resolution_notes,
-            },
-        )
+        # Resume automated interaction, recorded together with the resolution
+        self._audit_log.extend((
+            self._resume(case),
+            _audit_entry(
+                AuditEventType.ESCALATION_RESOLVED,
+                case,
+                clinician_id,
+                "CLINICIAN",
+                metadata={
+                    "new_state": EscalationState.RESOLVED.value,
+                    "resolution_notes": resolution_notes,
+                },
+            ),
+        ))
         return case
 
     def check_sla_timeout(
@@ -453,33 +508,36 @@ class EscalationOrchestrator:
         if case.clinician_notified_at is None:
             return case
 
-        now = datetime.now(timezone.utc)
-        elapsed = (now - case.clinician_notified_at).total_seconds()
+        now = self._clock()
+        elapsed = now - case.clinician_notified_at
 
-        if elapsed > policy.clinician_ack_sla_seconds:
-            # Transition to TIMED_OUT
-            case.state = EscalationState.TIMED_OUT
-            case.timed_out_at = now
+        # Compare timedeltas directly; seconds are only needed for the
+        # audit record once the SLA has actually been exceeded.
+        if elapsed <= _sla_window(policy.clinician_ack_sla_seconds):
+            return case
 
-            self._emit_audit(
-                event_type=AuditEventType.ESCALATION_TIMED_OUT,
-                case=case,
-                actor_id="SYSTEM",
+        # TIMED_OUT is passed through immediately: both transitions happen
+        # at the same instant and their entries are chained together.
+        case.timed_out_at = now
+        case.crisis_triggered_at = now
+        case.state = EscalationState.CRISIS_INTERFACE_TRIGGERED
+        self._awaiting_ack[case.org_id].pop(case.case_id, None)
+
+        self._audit_log.extend((
+            _audit_entry(
+                AuditEventType.ESCALATION_TIMED_OUT,
+                case,
+                "SYSTEM",
                 metadata={
                     "sla_seconds": policy.clinician_ack_sla_seconds,
-                    "elapsed_seconds": elapsed,
+                    "elapsed_seconds": elapsed.total_seconds(),
                     "new_state": EscalationState.TIMED_OUT.value,
                 },
-            )
-
-            # Immediately transition to CRISIS_INTERFACE_TRIGGERED
-            case.state = EscalationState.CRISIS_INTERFACE_TRIGGERED
-            case.crisis_triggered_at = datetime.now(timezone.utc)
-
-            self._emit_audit(
-                event_type=AuditEventType.CRISIS_INTERFACE_TRIGGERED,
-                case=case,
-                actor_id="SYSTEM",
+            ),
+            _audit_entry(
+                AuditEventType.CRISIS_INTERFACE_TRIGGERED,
+                case,
+                "SYSTEM",
                 metadata={
                     "new_state": EscalationState.CRISIS_INTERFACE_TRIGGERED.value,
                     "note": (
@@ -491,10 +549,40 @@ class EscalationOrchestrator:
                         t.name for t in policy.crisis_resource_targets
                     ],
                 },
-            )
-
+            ),
+        ))
         return case
 
+    def sweep_sla_timeouts(self, policy: PartnerPolicy) -> list[EscalationCase]:
+        """Run ``check_sla_timeout()`` over one organization's pending cases.
+
+        Only cases this orchestrator moved to CLINICIAN_NOTIFIED and that
+        are still awaiting acknowledgment are visited, so a periodic sweep
+        costs time proportional to the org's outstanding cases rather than
+        to every case ever opened.
+
+        Args:
+            policy: The partner policy whose organization is swept.
+
+        Returns:
+            The cases that timed out and triggered the crisis interface
+            during this sweep.
+        """
+        timed_out: list[EscalationCase] = []
+        pending = self._awaiting_ack.get(policy.org_id)
+        if not pending:
+            return timed_out
+        # check_sla_timeout() removes timed-out cases, so iterate a snapshot.
+        for case in list(pending.values()):
+            if case.state != EscalationState.CLINICIAN_NOTIFIED:
+                # Advanced through another path; nothing left to watch.
+                del pending[case.case_id]
+                continue
+            self.check_sla_timeout(case, policy)
+            if case.state == EscalationState.CRISIS_INTERFACE_TRIGGERED:
+                timed_out.append(case)
+        return timed_out
+
     def suspend_automated_interaction(self, case: EscalationCase) -> None:
         """Hard gate: block automated content for this participant.
 
@@ -502,25 +590,31 @@ class EscalationOrchestrator:
         content should be delivered.  This prevents the system from
         acting autonomously during an active escalation.
         """
+        self._audit_log.append(self._suspend(case))
+
+    def resume_automated_interaction(self, case: EscalationCase) -> None:
+        """Resume automated interaction after case resolution."""
+        self._audit_log.append(self._resume(case))
+
+    def _suspend(self, case: EscalationCase) -> AuditEntry:
+        """Apply the suspension gate and return its (unappended) audit entry."""
         case.automated_interaction_suspended = True
         self._suspended_participants.add(case.participant_id)
-
-        self._emit_audit(
-            event_type=AuditEventType.AUTOMATED_INTERACTION_SUSPENDED,
-            case=case,
-            actor_id="SYSTEM",
+        return _audit_entry(
+            AuditEventType.AUTOMATED_INTERACTION_SUSPENDED,
+            case,
+            "SYSTEM",
             metadata={"participant_id": case.participant_id},
         )
 
-    def resume_automated_interaction(self, case: EscalationCase) -> None:
-        """Resume automated interaction after case resolution."""
+    def _resume(self, case: EscalationCase) -> AuditEntry:
+        """Lift the suspension gate and return its (unappended) audit entry."""
         case.automated_interaction_suspended = False
         self._suspended_participants.discard(case.participant_id)
-
-        self._emit_audit(
-            event_type=AuditEventType.AUTOMATED_INTERACTION_RESUMED,
-            case=case,
-            actor_id="SYSTEM",
+        return _audit_entry(
+            AuditEventType.AUTOMATED_INTERACTION_RESUMED,
+            case,
+            "SYSTEM",
             metadata={"participant_id": case.participant_id},
         )
 
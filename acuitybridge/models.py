@@ -13,6 +13,7 @@ treatment recommendations.
 from __future__ import annotations
 
 import enum
+import functools
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
@@ -20,6 +21,11 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
+# Default factory for creation timestamps.  A partial calls straight into
+# ``datetime.now`` without the extra Python frame of a lambda.
+_utc_now = functools.partial(datetime.now, timezone.utc)
+
+
 # ---------------------------------------------------------------------------
 # Enums
 # ---------------------------------------------------------------------------
@@ -103,7 +109,7 @@ class Participant(BaseModel):
         ),
     )
     enrolled_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utc_now,
         description="UTC timestamp of enrollment.",
     )
     active: bool = Field(
@@ -132,7 +138,7 @@ class CheckIn(BaseModel):
         description="Partner organization ID.",
     )
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utc_now,
         description="UTC timestamp of the check-in.",
     )
     mood_score: Optional[float] = Field(
@@ -192,7 +198,7 @@ class BiomarkerReading(BaseModel):
         description="Partner organization ID.",
     )
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utc_now,
         description="UTC timestamp of the reading.",
     )
     metric_name: str = Field(
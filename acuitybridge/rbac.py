@@ -67,6 +67,20 @@ _PERMISSIONS: dict[tuple[Role, str], bool] = {
 }
 
 
+# Derived lookup tables: the set of allowed actions per role, and every
+# known action in declaration order.  A check is one dict probe and one
+# frozenset membership test -- no (role, action) tuple built per call.
+_ACTIONS: tuple[str, ...] = tuple(dict.fromkeys(a for _, a in _PERMISSIONS))
+_ALLOWED_BY_ROLE: dict[Role, frozenset[str]] = {
+    role: frozenset(
+        action for (r, action), allowed in _PERMISSIONS.items()
+        if r is role and allowed
+    )
+    for role in dict.fromkeys(r for r, _ in _PERMISSIONS)
+}
+_EMPTY: frozenset[str] = frozenset()
+
+
 def check_permission(role: Role, action: str) -> bool:
     """Check whether a role has permission to perform an action.
 
@@ -77,7 +91,7 @@ def check_permission(role: Role, action: str) -> bool:
     Returns:
         True if the role is permitted to perform the action, False otherwise.
     """
-    return _PERMISSIONS.get((role, action), False)
+    return action in _ALLOWED_BY_ROLE.get(role, _EMPTY)
 
 
 def require_permission(role: Role, action: str) -> None:
@@ -105,8 +119,7 @@ def get_permissions_for_role(role: Role) -> dict[str, bool]:
     Returns:
         Dictionary mapping action names to permission booleans.
     """
-    return {
-        action: allowed
-        for (r, action), allowed in _PERMISSIONS.items()
-        if r == role
-    }
+    allowed = _ALLOWED_BY_ROLE.get(role)
+    if allowed is None:
+        return {}
+    return {action: action in allowed for action in _ACTIONS}
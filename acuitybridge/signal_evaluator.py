@@ -24,10 +24,50 @@ or authorized human reviewer before any action is taken.
 
 from __future__ import annotations
 
-from acuitybridge.config import PartnerPolicy
+from typing import Iterable, Optional
+
+from acuitybridge.config import EscalationThresholds, PartnerPolicy
 from acuitybridge.models import BiomarkerReading, CheckIn, RiskFlag
 
 
+# Flags in increasing order of severity, and each flag's index in it.
+_FLAGS_BY_SEVERITY = (RiskFlag.GREEN, RiskFlag.YELLOW, RiskFlag.ORANGE, RiskFlag.RED)
+_SEVERITY = {flag: level for level, flag in enumerate(_FLAGS_BY_SEVERITY)}
+_GREEN, _YELLOW, _ORANGE, _RED = range(len(_FLAGS_BY_SEVERITY))
+
+
+# Reason text per reason code.  The evaluator records codes and arguments;
+# the text is formatted only when ``SignalEvaluationResult.reasons`` is
+# first read, so callers that only branch on the flag never pay for it.
+_REASON_TEMPLATES: dict[str, str] = {
+    "DISTRESS": "Distress level ({}) >= {} threshold ({}). Human review required.",
+    "LOW_MOOD": (
+        "Mood score ({}) <= low mood threshold ({}). Elevated for human review."
+    ),
+    "LOW_SLEEP": (
+        "Sleep quality ({}) <= low sleep threshold ({}). Elevated for human review."
+    ),
+    "KEYWORDS": (
+        "Escalation keywords detected: {}. "
+        "Immediate human review required per partner policy."
+    ),
+    "LOW_HRV": "Low HRV reading ({} {}). Supplementary signal elevated for human review.",
+    "VERY_LOW_SLEEP": (
+        "Very low sleep ({} hours). Supplementary signal elevated for human review."
+    ),
+    "ALL_GREEN": "All signals within GREEN thresholds. Human review optional.",
+}
+
+
+# Supplementary biomarker rules: metric name -> (value below which the
+# reading breaches, severity raised to, reason code).  Reason arguments are
+# ``(value, unit)``; templates use as many as they need.
+_BIOMARKER_RULES: dict[str, tuple[float, int, str]] = {
+    "heart_rate_variability": (20, _ORANGE, "LOW_HRV"),
+    "sleep_hours": (3, _ORANGE, "VERY_LOW_SLEEP"),
+}
+
+
 class SignalEvaluationResult:
     """Result of evaluating a participant's signals against policy thresholds.
 
@@ -35,9 +75,36 @@ class SignalEvaluationResult:
     explaining why the flag was raised.
     """
 
+    # One result per evaluated check-in; slots avoid a per-instance dict.
+    __slots__ = ("flag", "_reasons", "_reason_args")
+
     def __init__(self, flag: RiskFlag, reasons: list[str]) -> None:
         self.flag = flag
-        self.reasons = reasons
+        self._reasons: Optional[list[str]] = reasons
+        self._reason_args: list[tuple] = []
+
+    @classmethod
+    def _deferred(cls, flag: RiskFlag, reason_args: list[tuple]) -> SignalEvaluationResult:
+        """Build a result whose reasons are ``(code, *args)`` tuples, formatted lazily."""
+        result = cls.__new__(cls)
+        result.flag = flag
+        result._reasons = None
+        result._reason_args = reason_args
+        return result
+
+    @property
+    def reasons(self) -> list[str]:
+        """Human-readable reasons, formatted on first access."""
+        if self._reasons is None:
+            self._reasons = [
+                _REASON_TEMPLATES[code].format(*args)
+                for code, *args in self._reason_args
+            ]
+        return self._reasons
+
+    @reasons.setter
+    def reasons(self, reasons: list[str]) -> None:
+        self._reasons = reasons
 
     def requires_human_review(self) -> bool:
         """Whether this flag level requires mandatory human review."""
@@ -65,89 +132,90 @@ def evaluate_check_in(
     Returns:
         A ``SignalEvaluationResult`` with the computed flag and reasons.
     """
+    return _evaluate(
+        check_in, policy.escalation_thresholds, policy.keyword_set, biomarker_readings
+    )
+
+
+def evaluate_check_ins(
+    check_ins: Iterable[CheckIn],
+    policy: PartnerPolicy,
+) -> list[SignalEvaluationResult]:
+    """Evaluate many check-ins against one policy, e.g. to replay history.
+
+    Equivalent to calling ``evaluate_check_in()`` for each check-in (without
+    biomarker readings), but the policy's thresholds and keyword set are
+    resolved once for the whole batch, and reason text is only formatted
+    for results whose ``reasons`` are read.
+
+    Args:
+        check_ins: The participant check-ins to evaluate.
+        policy: The partner's workflow policy (defines thresholds).
+
+    Returns:
+        One ``SignalEvaluationResult`` per check-in, in input order.
+    """
     thresholds = policy.escalation_thresholds
-    flag = RiskFlag.GREEN
-    reasons: list[str] = []
+    keyword_set = policy.keyword_set
+    return [_evaluate(c, thresholds, keyword_set, None) for c in check_ins]
+
+
+def _evaluate(
+    check_in: CheckIn,
+    thresholds: EscalationThresholds,
+    keyword_set: frozenset[str],
+    biomarker_readings: Optional[list[BiomarkerReading]],
+) -> SignalEvaluationResult:
+    """Core of ``evaluate_check_in()`` with the policy lookups hoisted."""
+    # Severity is tracked as an index into _FLAGS_BY_SEVERITY, so raising
+    # it is a plain int comparison; the flag is looked up once at the end.
+    severity = _GREEN
+    reasons: list[tuple] = []
 
     # --- Check distress level ---
     if check_in.distress_level is not None:
-        if check_in.distress_level >= thresholds.red_min_distress:
-            flag = RiskFlag.RED
-            reasons.append(
-                f"Distress level ({check_in.distress_level}) >= RED threshold "
-                f"({thresholds.red_min_distress}). Human review required."
-            )
-        elif check_in.distress_level >= thresholds.orange_min_distress:
-            flag = _max_flag(flag, RiskFlag.ORANGE)
-            reasons.append(
-                f"Distress level ({check_in.distress_level}) >= ORANGE threshold "
-                f"({thresholds.orange_min_distress}). Human review required."
-            )
-        elif check_in.distress_level >= thresholds.yellow_min_distress:
-            flag = _max_flag(flag, RiskFlag.YELLOW)
+        distress_flag, threshold = thresholds.classify_distress(check_in.distress_level)
+        if distress_flag is not RiskFlag.GREEN:
+            severity = _SEVERITY[distress_flag]
             reasons.append(
-                f"Distress level ({check_in.distress_level}) >= YELLOW threshold "
-                f"({thresholds.yellow_min_distress}). Human review required."
+                ("DISTRESS", check_in.distress_level, distress_flag.value, threshold)
             )
 
     # --- Check mood score ---
     if check_in.mood_score is not None:
         if check_in.mood_score <= thresholds.low_mood_threshold:
-            flag = _max_flag(flag, RiskFlag.YELLOW)
+            if severity < _YELLOW:
+                severity = _YELLOW
             reasons.append(
-                f"Mood score ({check_in.mood_score}) <= low mood threshold "
-                f"({thresholds.low_mood_threshold}). Elevated for human review."
+                ("LOW_MOOD", check_in.mood_score, thresholds.low_mood_threshold)
             )
 
     # --- Check sleep quality ---
     if check_in.sleep_quality is not None:
         if check_in.sleep_quality <= thresholds.low_sleep_threshold:
-            flag = _max_flag(flag, RiskFlag.YELLOW)
+            if severity < _YELLOW:
+                severity = _YELLOW
             reasons.append(
-                f"Sleep quality ({check_in.sleep_quality}) <= low sleep threshold "
-                f"({thresholds.low_sleep_threshold}). Elevated for human review."
+                ("LOW_SLEEP", check_in.sleep_quality, thresholds.low_sleep_threshold)
             )
 
     # --- Check keyword flags ---
     if check_in.keyword_flags:
-        all_keywords = set(policy.escalation_keyword_overrides)
-        matched = [kw for kw in check_in.keyword_flags if kw in all_keywords]
+        matched = [kw for kw in check_in.keyword_flags if kw in keyword_set]
         if matched:
-            flag = RiskFlag.RED
-            reasons.append(
-                f"Escalation keywords detected: {matched}. "
-                "Immediate human review required per partner policy."
-            )
+            severity = _RED
+            reasons.append(("KEYWORDS", matched))
 
     # --- Check biomarker readings (supplementary signals) ---
     if biomarker_readings:
         for reading in biomarker_readings:
-            if reading.metric_name == "heart_rate_variability" and reading.value < 20:
-                flag = _max_flag(flag, RiskFlag.ORANGE)
-                reasons.append(
-                    f"Low HRV reading ({reading.value} {reading.unit}). "
-                    "Supplementary signal elevated for human review."
-                )
-            if reading.metric_name == "sleep_hours" and reading.value < 3:
-                flag = _max_flag(flag, RiskFlag.ORANGE)
-                reasons.append(
-                    f"Very low sleep ({reading.value} hours). "
-                    "Supplementary signal elevated for human review."
-                )
+            rule = _BIOMARKER_RULES.get(reading.metric_name)
+            if rule is not None and reading.value < rule[0]:
+                if severity < rule[1]:
+                    severity = rule[1]
+                reasons.append((rule[2], reading.value, reading.unit))
 
     if not reasons:
-        reasons.append("All signals within GREEN thresholds. Human review optional.")
-
-    return SignalEvaluationResult(flag=flag, reasons=reasons)
-
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-_FLAG_ORDER = {RiskFlag.GREEN: 0, RiskFlag.YELLOW: 1, RiskFlag.ORANGE: 2, RiskFlag.RED: 3}
-
+        reasons.append(("ALL_GREEN",))
 
-def _max_flag(a: RiskFlag, b: RiskFlag) -> RiskFlag:
-    """Return the higher (more severe) of two flags."""
-    return a if _FLAG_ORDER[a] >= _FLAG_ORDER[b] else b
+    return SignalEvaluationResult._deferred(_FLAGS_BY_SEVERITY[severity], reasons)
@@ -14,15 +14,74 @@ or treatment recommendations.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable
 
 from acuitybridge.escalation import EscalationCase
-from acuitybridge.models import EscalationState
+from acuitybridge.models import EscalationState, RiskFlag
+
+
+# ---------------------------------------------------------------------------
+# Enum value lookups
+# ---------------------------------------------------------------------------
+
+# ``Enum.value`` goes through a descriptor on every access; report building
+# reads these per event, so resolve them once.
+_STATE_STRS: dict[EscalationState, str] = {s: s.value for s in EscalationState}
+_FLAG_STRS: dict[RiskFlag, str] = {f: f.value for f in RiskFlag}
+
+# ---------------------------------------------------------------------------
+# Timeline event table
+# ---------------------------------------------------------------------------
+
+# (case timestamp attribute, state, description) in timeline order.  The
+# ``{clinician}`` and ``{notes}`` placeholders are filled from the case.
+_EVENT_SPEC: tuple[tuple[str, EscalationState, str], ...] = (
+    ("created_at", EscalationState.DETECTED, "Escalation case opened."),
+    (
+        "alert_sent_at",
+        EscalationState.ALERT_SENT,
+        "Alert sent through notification channels.",
+    ),
+    (
+        "clinician_notified_at",
+        EscalationState.CLINICIAN_NOTIFIED,
+        "Clinician {clinician} notified.",
+    ),
+    (
+        "acknowledged_at",
+        EscalationState.ACKNOWLEDGED,
+        "Acknowledged by clinician {clinician}.",
+    ),
+    ("resolved_at", EscalationState.RESOLVED, "Resolved. Notes: {notes}"),
+    (
+        "timed_out_at",
+        EscalationState.TIMED_OUT,
+        "Clinician acknowledgment SLA exceeded.",
+    ),
+    (
+        "crisis_triggered_at",
+        EscalationState.CRISIS_INTERFACE_TRIGGERED,
+        "Crisis resource interface triggered per partner policy. "
+        "Human oversight expected at receiving end.",
+    ),
+)
 
 
 class TransparencyReport:
     """A structured Decision Transparency Report for clinician review."""
 
+    __slots__ = (
+        "case_id",
+        "participant_id",
+        "org_id",
+        "flag_level",
+        "current_state",
+        "triggering_indicators",
+        "timeline",
+        "reasoning_chain",
+        "generated_at",
+    )
+
     def __init__(
         self,
         case_id: str,
@@ -74,19 +133,23 @@ class TransparencyReport:
 def generate_transparency_report(
     case: EscalationCase,
     evaluation_reasons: list[str] | None = None,
+    generated_at: str | None = None,
 ) -> TransparencyReport:
     """Generate a Decision Transparency Report from an escalation case.
 
     Args:
         case: The escalation case.
         evaluation_reasons: Optional list of reasons from the signal evaluator.
+        generated_at: Optional ISO-8601 generation timestamp.  Defaults to
+            the current UTC time.
 
     Returns:
         A ``TransparencyReport`` instance ready for clinician review.
     """
     timeline = _build_timeline(case)
+    flag_level = _FLAG_STRS[case.flag_level]
     reasoning = evaluation_reasons or [
-        f"Flag level {case.flag_level.value} triggered by indicators: "
+        f"Flag level {flag_level} triggered by indicators: "
         + ", ".join(case.triggering_indicators)
     ]
 
@@ -94,63 +157,52 @@ def generate_transparency_report(
         case_id=case.case_id,
         participant_id=case.participant_id,
         org_id=case.org_id,
-        flag_level=case.flag_level.value,
-        current_state=case.state.value,
-        triggering_indicators=case.triggering_indicators,
+        flag_level=flag_level,
+        current_state=_STATE_STRS[case.state],
+        triggering_indicators=list(case.triggering_indicators),
         timeline=timeline,
         reasoning_chain=reasoning,
-        generated_at=datetime.now(timezone.utc).isoformat(),
+        generated_at=generated_at or datetime.now(timezone.utc).isoformat(),
     )
 
 
+def generate_transparency_reports(
+    cases: Iterable[EscalationCase],
+) -> list[TransparencyReport]:
+    """Generate Decision Transparency Reports for a batch of cases.
+
+    All reports in the batch share a single ``generated_at`` timestamp.
+
+    Args:
+        cases: The escalation cases to report on.
+
+    Returns:
+        One ``TransparencyReport`` per case, in input order.
+    """
+    generated_at = datetime.now(timezone.utc).isoformat()
+    return [
+        generate_transparency_report(case, generated_at=generated_at)
+        for case in cases
+    ]
+
+
 def _build_timeline(case: EscalationCase) -> list[dict[str, str]]:
     """Build a chronological timeline of case state transitions."""
+    clinician = case.assigned_clinician_id or "unknown"
     events: list[dict[str, str]] = []
 
-    if case.created_at:
-        events.append({
-            "state": EscalationState.DETECTED.value,
-            "timestamp": case.created_at.isoformat(),
-            "description": "Escalation case opened.",
-        })
-    if case.alert_sent_at:
-        events.append({
-            "state": EscalationState.ALERT_SENT.value,
-            "timestamp": case.alert_sent_at.isoformat(),
-            "description": "Alert sent through notification channels.",
-        })
-    if case.clinician_notified_at:
-        events.append({
-            "state": EscalationState.CLINICIAN_NOTIFIED.value,
-            "timestamp": case.clinician_notified_at.isoformat(),
-            "description": f"Clinician {case.assigned_clinician_id or 'unknown'} notified.",
-        })
-    if case.acknowledged_at:
-        events.append({
-            "state": EscalationState.ACKNOWLEDGED.value,
-            "timestamp": case.acknowledged_at.isoformat(),
-            "description": f"Acknowledged by clinician {case.assigned_clinician_id or 'unknown'}.",
-        })
-    if case.resolved_at:
-        events.append({
-            "state": EscalationState.RESOLVED.value,
-            "timestamp": case.resolved_at.isoformat(),
-            "description": f"Resolved. Notes: {case.resolution_notes}",
-        })
-    if case.timed_out_at:
+    for attr, state, description in _EVENT_SPEC:
+        timestamp = getattr(case, attr)
+        if timestamp is None:
+            continue
+        if "{" in description:
+            description = description.format(
+                clinician=clinician, notes=case.resolution_notes,
+            )
         events.append({
-            "state": EscalationState.TIMED_OUT.value,
-            "timestamp": case.timed_out_at.isoformat(),
-            "description": "Clinician acknowledgment SLA exceeded.",
-        })
-    if case.crisis_triggered_at:
-        events.append({
-            "state": EscalationState.CRISIS_INTERFACE_TRIGGERED.value,
-            "timestamp": case.crisis_triggered_at.isoformat(),
-            "description": (
-                "Crisis resource interface triggered per partner policy. "
-                "Human oversight expected at receiving end."
-            ),
+            "state": _STATE_STRS[state],
+            "timestamp": timestamp.isoformat(),
+            "description": description,
         })
 
     return events
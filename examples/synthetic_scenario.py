@@ -126,15 +126,16 @@ def main() -> None:
     print(f"  Requires human review: {result_day1.requires_human_review()}")
     print(f"  Reasons: {result_day1.reasons}")
 
-    # Log the evaluation
-    audit_log.append(AuditEntry(
+    # Log the evaluation; evaluation entries are collected and chained into
+    # the audit log in one batch before the escalation opens.
+    evaluation_entries = [AuditEntry(
         org_id=policy.org_id,
         actor_id="SYSTEM",
         actor_role="SYSTEM",
         event_type=AuditEventType.SIGNAL_EVALUATED,
         target_entity=participant.participant_id,
         metadata={"flag": result_day1.flag.value, "reasons": result_day1.reasons},
-    ))
+    )]
 
     # ------------------------------------------------------------------
     # Step 5: Day 5 -- RED check-in (elevated distress + keyword)
@@ -158,7 +159,7 @@ def main() -> None:
     for reason in result_day5.reasons:
         print(f"  - {reason}")
 
-    audit_log.append(AuditEntry(
+    evaluation_entries.append(AuditEntry(
         org_id=policy.org_id,
         actor_id="SYSTEM",
         actor_role="SYSTEM",
@@ -166,6 +167,7 @@ def main() -> None:
         target_entity=participant.participant_id,
         metadata={"flag": result_day5.flag.value, "reasons": result_day5.reasons},
     ))
+    audit_log.extend(evaluation_entries)
 
     # ------------------------------------------------------------------
     # Step 6: Escalation lifecycle
@@ -213,8 +215,8 @@ def main() -> None:
     _banner("Step 6: Decision Transparency Report")
 
     report = generate_transparency_report(case, evaluation_reasons=result_day5.reasons)
-    report_dict = report.to_dict()
-    print(json.dumps(report_dict, indent=2, default=str))
+    json.dump(report.to_dict(), sys.stdout, indent=2)
+    print()
 
     # ------------------------------------------------------------------
     # Step 8: Export audit log
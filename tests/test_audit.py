@@ -3,11 +3,13 @@ Tests for acuitybridge.audit -- Append-Only, Tamper-Evident Audit Log.
 
 Covers: append + chain verification, tamper detection, query filtering,
 export format, PHI redaction, empty log verification, concurrent append
-ordering, and multi-tenant audit isolation.
+ordering, multi-tenant audit isolation, and per-tenant audit logs.
 """
 
 from __future__ import annotations
 
+import json
+import threading
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -16,6 +18,7 @@ from acuitybridge.audit import (
     AuditEntry,
     AuditEventType,
     AuditLog,
+    PerTenantAuditLog,
     redact_phi_from_metadata,
 )
 
@@ -61,6 +64,48 @@ class TestAppendAndChainVerification:
         assert e2.previous_hash == e1.compute_hash()
         assert e3.previous_hash == e2.compute_hash()
 
+    def test_canonical_bytes_are_sorted_json(self):
+        """The canonical form is stable: hashes must not change across releases."""
+        entry = _make_entry(
+            actor_id='dr "o\u00e9"\n',
+            metadata={"b": 1, "a": {"z": 2, "y": [1, 2]}},
+        )
+        expected = json.dumps(
+            {
+                "entry_id": entry.entry_id,
+                "timestamp": entry.timestamp.isoformat(),
+                "org_id": entry.org_id,
+                "actor_id": entry.actor_id,
+                "actor_role": entry.actor_role,
+                "event_type": entry.event_type.value,
+                "target_entity": entry.target_entity,
+                "metadata": entry.metadata,
+                "previous_hash": entry.previous_hash,
+            },
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+        assert entry.canonical_bytes() == expected
+
+    def test_previous_hash_shares_stored_digest(self):
+        log = AuditLog()
+        log.append(_make_entry(actor_id="actor_1"))
+        e2 = log.append(_make_entry(actor_id="actor_2"))
+        assert e2.previous_hash is log._hashes[0]
+
+    def test_extend_links_batch_like_append(self):
+        log = AuditLog()
+        first = log.append(_make_entry(actor_id="actor_0"))
+        batch = log.extend(_make_entry(actor_id=f"actor_{i}") for i in range(1, 4))
+
+        assert len(log) == 4
+        assert batch[0].previous_hash == first.compute_hash()
+        assert batch[2].previous_hash == batch[1].compute_hash()
+        assert [e.actor_id for e in log.query(org_id="org_a")] == [
+            "actor_0", "actor_1", "actor_2", "actor_3",
+        ]
+        assert log.verify_chain() == (True, None)
+
     def test_chain_verification_passes_for_valid_log(self):
         log = AuditLog()
         for i in range(5):
@@ -103,6 +148,36 @@ class TestTamperDetection:
         valid, broken_at = log.verify_chain()
         assert valid is False
 
+    def test_incremental_verification_checks_only_new_entries(self):
+        log = AuditLog()
+        log.append(_make_entry(actor_id="actor_1"))
+        log.append(_make_entry(actor_id="actor_2"))
+        assert log.verify_chain() == (True, None)
+
+        log.append(_make_entry(actor_id="actor_3"))
+        log._entries[2].metadata = {"tampered": True}
+        assert log.verify_chain(incremental=True) == (False, 2)
+
+    def test_incremental_verification_skips_verified_prefix(self):
+        log = AuditLog()
+        log.append(_make_entry(actor_id="actor_1"))
+        assert log.verify_chain() == (True, None)
+
+        log._entries[0].actor_id = "TAMPERED"
+        log.append(_make_entry(actor_id="actor_2"))
+        # Earlier entries are only re-checked by the full walk.
+        assert log.verify_chain(incremental=True) == (True, None)
+        assert log.verify_chain() == (False, 0)
+
+    def test_rewritten_previous_hash_detected(self):
+        log = AuditLog()
+        log.append(_make_entry(actor_id="actor_1"))
+        log.append(_make_entry(actor_id="actor_2"))
+
+        log._entries[1].previous_hash = "0" * 64
+
+        assert log.verify_chain() == (False, 1)
+
 
 # ---------------------------------------------------------------------------
 # 3. Empty log verification
@@ -168,6 +243,41 @@ class TestQueryFiltering:
         )
         assert len(results) == 1
 
+    def test_query_time_window_keeps_insertion_order(self):
+        log = AuditLog()
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        offsets = [5, 1, 30, 3, 2, 40, 4]
+        for minutes in offsets:
+            entry = _make_entry(actor_id=f"a{minutes}")
+            entry.timestamp = base + timedelta(minutes=minutes)
+            log.append(entry)
+        log.append(_make_entry(org_id="org_b"))
+
+        results = log.query(
+            org_id="org_a",
+            time_start=base + timedelta(minutes=2),
+            time_end=base + timedelta(minutes=5),
+        )
+        assert [e.actor_id for e in results] == ["a5", "a3", "a2", "a4"]
+        assert log.query(
+            org_id="org_a", actor_id="a3", time_end=base + timedelta(minutes=3)
+        )[0].actor_id == "a3"
+
+    def test_query_time_bounds_are_inclusive_across_timezones(self):
+        log = AuditLog()
+        now = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        entry = _make_entry()
+        entry.timestamp = now
+        log.append(entry)
+
+        plus_two = timezone(timedelta(hours=2))
+        same_instant = now.astimezone(plus_two)
+        assert len(log.query(org_id="org_a", time_start=same_instant)) == 1
+        assert len(log.query(org_id="org_a", time_end=same_instant)) == 1
+        assert log.query(
+            org_id="org_a", time_start=same_instant + timedelta(microseconds=1)
+        ) == []
+
     def test_query_by_actor_id(self):
         log = AuditLog()
         log.append(_make_entry(actor_id="clinician_1"))
@@ -177,6 +287,60 @@ class TestQueryFiltering:
         results = log.query(org_id="org_a", actor_id="clinician_2")
         assert len(results) == 1
 
+    def test_query_combined_filters_across_orgs(self):
+        log = AuditLog()
+        log.append(_make_entry(org_id="org_a", actor_id="clinician_1"))
+        log.append(_make_entry(
+            org_id="org_a", actor_id="clinician_1",
+            event_type=AuditEventType.ESCALATION_OPENED,
+        ))
+        log.append(_make_entry(
+            org_id="org_b", actor_id="clinician_1",
+            event_type=AuditEventType.ESCALATION_OPENED,
+        ))
+        log.append(_make_entry(
+            org_id="org_a", actor_id="clinician_2",
+            event_type=AuditEventType.ESCALATION_OPENED,
+        ))
+
+        results = log.query(
+            org_id="org_a",
+            event_type=AuditEventType.ESCALATION_OPENED,
+            actor_id="clinician_1",
+        )
+        assert len(results) == 1
+        assert results[0].org_id == "org_a"
+        assert log.query(org_id="org_c") == []
+
+    def test_count_by_type(self):
+        log = AuditLog()
+        log.append(_make_entry())
+        log.append(_make_entry(event_type=AuditEventType.ESCALATION_OPENED))
+        log.append(_make_entry())
+        log.append(_make_entry(org_id="org_b"))
+
+        counts = log.count_by_type("org_a")
+        assert counts == {
+            AuditEventType.SIGNAL_EVALUATED: 2,
+            AuditEventType.ESCALATION_OPENED: 1,
+        }
+        assert counts[AuditEventType.ESCALATION_RESOLVED] == 0
+        assert log.count_by_type("org_c") == {}
+
+    def test_query_results_do_not_alias_log_entries(self):
+        log = AuditLog()
+        log.append(_make_entry(actor_id="clinician_1", metadata={"indicators": ["kw"]}))
+
+        result = log.query(org_id="org_a")[0]
+        result.actor_id = "changed"
+        result.metadata["indicators"].append("edited")
+        result.metadata["edited"] = True
+
+        stored = log.query(org_id="org_a")[0]
+        assert stored.actor_id == "clinician_1"
+        assert stored.metadata == {"indicators": ["kw"]}
+        assert log.verify_chain() == (True, None)
+
 
 # ---------------------------------------------------------------------------
 # 5. Multi-tenant audit isolation
@@ -229,12 +393,58 @@ class TestPHIRedaction:
         assert redacted["email"] == "[REDACTED]"
         assert redacted["flag_level"] == "RED"
 
+    def test_redact_phi_keys_case_insensitively(self):
+        redacted = redact_phi_from_metadata({"Full_Name": "Jane Doe", "SSN": "x"})
+        assert redacted == {"Full_Name": "[REDACTED]", "SSN": "[REDACTED]"}
+
     def test_redact_ssn_pattern_in_values(self):
         metadata = {"notes": "Participant SSN is 123-45-6789 on file."}
         redacted = redact_phi_from_metadata(metadata)
         assert "123-45-6789" not in redacted["notes"]
         assert "[REDACTED-SSN]" in redacted["notes"]
 
+    def test_redact_multiple_patterns_in_one_value(self):
+        metadata = {
+            "notes": "SSN 123-45-6789, born 1990-04-12, call 555-123-4567 or a@b.org",
+        }
+        redacted = redact_phi_from_metadata(metadata)
+        assert redacted["notes"] == (
+            "SSN [REDACTED-SSN], born [REDACTED-DOB], call [REDACTED-PHONE] "
+            "or [REDACTED-EMAIL]"
+        )
+
+    def test_redact_each_pattern_alone(self):
+        cases = {
+            "ssn 123-45-6789": "ssn [REDACTED-SSN]",
+            "born 1990-04-12": "born [REDACTED-DOB]",
+            "call 555.123.4567": "call [REDACTED-PHONE]",
+            "mail a@b.org": "mail [REDACTED-EMAIL]",
+            "score (9.0) >= threshold (8.0)": "score (9.0) >= threshold (8.0)",
+        }
+        for value, expected in cases.items():
+            assert redact_phi_from_metadata({"notes": value}) == {"notes": expected}
+
+    def test_redact_email_at_length_limits(self):
+        email = "a" * 64 + "@" + "b" * 250 + ".org"
+        redacted = redact_phi_from_metadata({"notes": f"contact {email} today"})
+        assert redacted["notes"] == "contact [REDACTED-EMAIL] today"
+
+    def test_redact_email_with_over_long_local_part(self):
+        redacted = redact_phi_from_metadata({"notes": "contact " + "x" * 65 + "@example.com"})
+        assert redacted["notes"] == "contact [REDACTED-EMAIL]"
+
+    def test_redact_email_with_over_long_domain(self):
+        redacted = redact_phi_from_metadata({"notes": "x@" + "d" * 256 + ".com"})
+        assert redacted["notes"] == "[REDACTED-EMAIL]"
+
+    def test_redact_long_dotted_value_without_phi(self):
+        value = "a." * 5000
+        assert redact_phi_from_metadata({"notes": value}) == {"notes": value}
+
+    def test_redact_long_dotted_value_around_at_sign(self):
+        for value in ("x@" + "a." * 5000, "a." * 5000 + "@", "x@" * 5000):
+            assert redact_phi_from_metadata({"notes": value}) == {"notes": value}
+
     def test_redact_nested_metadata(self):
         metadata = {
             "outer": {
@@ -246,6 +456,22 @@ class TestPHIRedaction:
         assert redacted["outer"]["name"] == "[REDACTED]"
         assert redacted["outer"]["score"] == 7.5
 
+    def test_redact_deeply_nested_metadata(self):
+        metadata: dict = {"email": "x@y.com"}
+        for _ in range(2000):
+            metadata = {"level": metadata}
+
+        redacted = redact_phi_from_metadata(metadata)
+        for _ in range(2000):
+            redacted = redacted["level"]
+        assert redacted == {"email": "[REDACTED]"}
+
+    def test_export_redacts_phi_keys_with_non_string_values(self):
+        log = AuditLog()
+        log.append(_make_entry(metadata={"phone": 5551234567, "score": 3}))
+        export = log.export_for_review(org_id="org_a")
+        assert export["entries"][0]["metadata"] == {"phone": "[REDACTED]", "score": 3}
+
     def test_export_applies_redaction(self):
         log = AuditLog()
         log.append(_make_entry(
@@ -282,6 +508,68 @@ class TestExportFormat:
         export = log.export_for_review(org_id="org_a")
         assert export["export_metadata"]["chain_integrity"] == "VALID"
 
+    def test_export_reports_tampering_outside_exported_range(self):
+        log = AuditLog()
+        log.append(_make_entry(org_id="org_b"))
+        log.append(_make_entry())
+        assert log.verify_chain() == (True, None)
+        log._entries[0].metadata = {"tampered": True}
+
+        export = log.export_for_review(org_id="org_a")
+        assert export["export_metadata"]["entry_count"] == 1
+        assert export["export_metadata"]["chain_integrity"] == "BROKEN_AT_INDEX_0"
+
+    def test_export_entries_match_entry_fields(self):
+        log = AuditLog()
+        entry = log.append(_make_entry(metadata={"score": {"value": 3}}))
+        exported = log.export_for_review(org_id="org_a")["entries"][0]
+
+        assert exported == {
+            **entry.model_dump(),
+            "timestamp": entry.timestamp.isoformat(),
+        }
+        exported["metadata"]["score"]["value"] = 99
+        assert log.verify_chain() == (True, None)
+
+    def test_export_nested_containers_on_redaction_path_are_copies(self):
+        log = AuditLog()
+        metadata = {
+            "notes": "SSN 123-45-6789",
+            "detail": {"indicators": ["kw"], "pairs": [{"k": "v"}]},
+            "history": [["a"], {"b": 1}],
+        }
+        log.append(_make_entry(metadata=metadata))
+        exported = log.export_for_review(org_id="org_a")["entries"][0]["metadata"]
+        assert exported["notes"] == "SSN [REDACTED-SSN]"
+
+        exported["detail"]["indicators"].append("edited")
+        exported["detail"]["pairs"][0]["k"] = "edited"
+        exported["history"][0].append("edited")
+        exported["history"][1]["b"] = 2
+        assert log.query(org_id="org_a")[0].metadata == {
+            "notes": "SSN 123-45-6789",
+            "detail": {"indicators": ["kw"], "pairs": [{"k": "v"}]},
+            "history": [["a"], {"b": 1}],
+        }
+        assert log.verify_chain() == (True, None)
+
+        redacted = redact_phi_from_metadata(metadata)
+        assert redacted["history"] is not metadata["history"]
+        assert redacted["detail"]["indicators"] is not metadata["detail"]["indicators"]
+
+    def test_export_list_metadata_does_not_alias_log(self):
+        log = AuditLog()
+        # The string value sends this metadata down the redaction path.
+        metadata = {"flag": "RED", "reasons": ["Distress high."]}
+        log.append(_make_entry(metadata=metadata))
+        exported = log.export_for_review(org_id="org_a")["entries"][0]
+
+        exported["metadata"]["reasons"].append("edited")
+        assert log.query(org_id="org_a")[0].metadata == {
+            "flag": "RED", "reasons": ["Distress high."],
+        }
+        assert log.verify_chain() == (True, None)
+
     def test_export_scope_note_mentions_worm(self):
         """The export should include the honest scope note about WORM storage."""
         log = AuditLog()
@@ -306,3 +594,64 @@ class TestAppendOrdering:
         results = log.query(org_id="org_a")
         result_ids = [e.entry_id for e in results]
         assert result_ids == ids
+
+    def test_concurrent_appends_keep_chain_intact(self):
+        log = AuditLog()
+
+        def produce(worker: int) -> None:
+            for i in range(200):
+                log.append(_make_entry(actor_id=f"actor_{worker}_{i}"))
+
+        threads = [threading.Thread(target=produce, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(log) == 800
+        assert log.verify_chain() == (True, None)
+
+
+# ---------------------------------------------------------------------------
+# 9. Per-tenant audit logs
+# ---------------------------------------------------------------------------
+
+class TestPerTenantAuditLog:
+    def test_entries_are_chained_per_tenant(self):
+        logs = PerTenantAuditLog()
+        a1 = logs.append(_make_entry(org_id="org_a"))
+        logs.append(_make_entry(org_id="org_b"))
+        a2 = logs.append(_make_entry(org_id="org_a"))
+
+        assert a2.previous_hash == a1.compute_hash()
+        assert len(logs) == 3
+        assert logs.list_orgs() == ["org_a", "org_b"]
+        assert [e.entry_id for e in logs.query(org_id="org_a")] == [
+            a1.entry_id, a2.entry_id,
+        ]
+        assert logs.query(org_id="org_c") == []
+        assert logs.count_by_type("org_a") == {AuditEventType.SIGNAL_EVALUATED: 2}
+        assert logs.count_by_type("org_c") == {}
+
+    def test_extend_groups_entries_by_tenant(self):
+        logs = PerTenantAuditLog()
+        batch = [_make_entry(org_id=org) for org in ("org_a", "org_b", "org_a")]
+        assert logs.extend(batch) == batch
+        assert len(logs.log_for("org_a")) == 2
+        assert batch[2].previous_hash == batch[0].compute_hash()
+
+    def test_tampering_is_scoped_to_one_tenant(self):
+        logs = PerTenantAuditLog()
+        logs.append(_make_entry(org_id="org_a"))
+        tampered = logs.append(_make_entry(org_id="org_b"))
+        tampered.actor_id = "someone_else"
+
+        assert logs.verify_chain("org_a") == (True, None)
+        assert logs.verify_chain("org_b") == (False, 0)
+        assert logs.export_for_review("org_a")["export_metadata"]["chain_integrity"] == "VALID"
+        assert logs.verify_chain("org_c") == (True, None)
+
+    def test_export_for_unknown_tenant_is_empty(self):
+        export = PerTenantAuditLog().export_for_review("org_a")
+        assert export["entries"] == []
+        assert export["export_metadata"]["chain_integrity"] == "VALID"
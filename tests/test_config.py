@@ -17,6 +17,7 @@ from acuitybridge.config import (
     EscalationThresholds,
     PartnerPolicy,
     PolicyRegistry,
+    iter_policies_from_yaml,
     load_policies_from_yaml,
 )
 from acuitybridge.models import CrisisResourceTarget, RiskFlag
@@ -41,6 +42,57 @@ class TestDefaultPolicy:
         assert RiskFlag.ORANGE in DEFAULT_POLICY.human_review_required_flags
         assert RiskFlag.RED in DEFAULT_POLICY.human_review_required_flags
 
+    def test_default_policy_is_built_once(self):
+        import acuitybridge.config as config
+
+        assert config.DEFAULT_POLICY is config.DEFAULT_POLICY
+        with pytest.raises(AttributeError):
+            config.NOT_A_POLICY
+
+    def test_list_fields_are_stored_as_tuples(self):
+        policy = PartnerPolicy(
+            org_id="tuple_org",
+            org_name="Tuple Org",
+            notification_channels=["sms", "dashboard"],
+            escalation_keyword_overrides=["relapse"],
+        )
+        assert policy.notification_channels == ("sms", "dashboard")
+        assert policy.escalation_keyword_overrides == ("relapse",)
+        assert DEFAULT_POLICY.notification_channels == ("dashboard",)
+
+    def test_keyword_set_follows_overrides(self):
+        policy = PartnerPolicy(
+            org_id="kw_org", org_name="KW Org", escalation_keyword_overrides=["relapse"]
+        )
+        assert policy.keyword_set == frozenset({"relapse"})
+
+        policy.escalation_keyword_overrides = ("overdose",)
+        assert policy.keyword_set == frozenset({"overdose"})
+        assert "keyword_set" not in policy.model_dump()
+
+    def test_equality_holds_after_keyword_set_is_read(self):
+        kwargs = dict(org_id="kw_org", org_name="KW Org", escalation_keyword_overrides=["relapse"])
+        policy, twin = PartnerPolicy(**kwargs), PartnerPolicy(**kwargs)
+        assert policy.keyword_set == frozenset({"relapse"})
+        assert policy == twin
+        assert twin == policy
+
+    def test_human_review_flags_accept_list_input(self):
+        policy = PartnerPolicy(
+            org_id="all_review",
+            org_name="All Review Org",
+            human_review_required_flags=["GREEN", "YELLOW", "YELLOW"],
+        )
+        assert policy.human_review_required_flags == frozenset(
+            {RiskFlag.GREEN, RiskFlag.YELLOW}
+        )
+        assert policy.model_dump(mode="json")["human_review_required_flags"] == [
+            "GREEN", "YELLOW"
+        ]
+        assert DEFAULT_POLICY.model_dump(mode="json")["human_review_required_flags"] == [
+            "YELLOW", "ORANGE", "RED"
+        ]
+
 
 # ---------------------------------------------------------------------------
 # 2. Partner policy validation
@@ -84,6 +136,14 @@ class TestPartnerPolicyValidation:
                 consent_model="maybe",
             )
 
+    def test_unknown_notification_channel_rejected(self):
+        with pytest.raises(Exception):
+            PartnerPolicy(
+                org_id="bad_channel",
+                org_name="Bad Channel Org",
+                notification_channels=["dashboard", "pager"],
+            )
+
 
 # ---------------------------------------------------------------------------
 # 3. Escalation threshold ordering
@@ -98,6 +158,32 @@ class TestEscalationThresholds:
         )
         assert t.yellow_min_distress < t.orange_min_distress < t.red_min_distress
 
+    def test_json_schema_matches_pydantic_and_is_a_copy(self):
+        schema = EscalationThresholds.json_schema()
+        assert schema == EscalationThresholds.model_json_schema()
+        schema["title"] = "changed"
+        assert EscalationThresholds.json_schema()["title"] == "EscalationThresholds"
+        assert PartnerPolicy.json_schema() == PartnerPolicy.model_json_schema()
+
+    def test_classify_distress_buckets(self):
+        t = EscalationThresholds(
+            yellow_min_distress=3.0,
+            orange_min_distress=5.0,
+            red_min_distress=7.0,
+        )
+        assert t.classify_distress(2.9) == (RiskFlag.GREEN, None)
+        assert t.classify_distress(3.0) == (RiskFlag.YELLOW, 3.0)
+        assert t.classify_distress(6.9) == (RiskFlag.ORANGE, 5.0)
+        assert t.classify_distress(10.0) == (RiskFlag.RED, 7.0)
+
+    def test_classify_distress_equal_cutoffs_pick_highest_flag(self):
+        t = EscalationThresholds(
+            yellow_min_distress=5.0,
+            orange_min_distress=5.0,
+            red_min_distress=8.0,
+        )
+        assert t.classify_distress(5.0) == (RiskFlag.ORANGE, 5.0)
+
     def test_orange_below_yellow_rejected(self):
         with pytest.raises(Exception):
             EscalationThresholds(
@@ -106,6 +192,10 @@ class TestEscalationThresholds:
                 red_min_distress=7.0,
             )
 
+    def test_ordering_error_names_offending_threshold(self):
+        with pytest.raises(ValueError, match="red_min_distress \\(4.0\\) must be >="):
+            EscalationThresholds(red_min_distress=4.0)
+
     def test_red_below_orange_rejected(self):
         with pytest.raises(Exception):
             EscalationThresholds(
@@ -135,6 +225,14 @@ class TestPolicyRegistry:
         with pytest.raises(ValueError, match="already registered"):
             registry.register(policy)
 
+    def test_rejected_duplicate_keeps_original(self):
+        registry = PolicyRegistry()
+        registry.register(PartnerPolicy(org_id="org_a", org_name="Org A"))
+        with pytest.raises(ValueError):
+            registry.register(PartnerPolicy(org_id="org_a", org_name="Impostor"))
+        assert registry.get("org_a").org_name == "Org A"
+        assert registry.list_orgs() == ["org_a"]
+
     def test_get_nonexistent_org_raises_key_error(self):
         registry = PolicyRegistry()
         with pytest.raises(KeyError):
@@ -177,12 +275,59 @@ class TestPolicyRegistry:
         with pytest.raises(KeyError):
             registry.update(policy)
 
+    def test_register_and_update_reject_policy_mutated_out_of_order(self):
+        registry = PolicyRegistry()
+        registry.register(PartnerPolicy(org_id="org_a", org_name="Org A"))
+        mutated = PartnerPolicy(org_id="org_b", org_name="Org B")
+        mutated.escalation_thresholds.red_min_distress = 1.0
+
+        with pytest.raises(ValueError, match="red_min_distress"):
+            registry.register(mutated)
+        assert registry.list_orgs() == ["org_a"]
+
+        mutated.org_id = "org_a"
+        with pytest.raises(ValueError, match="red_min_distress"):
+            registry.update(mutated)
+        assert registry.get("org_a").org_name == "Org A"
+
     def test_list_orgs_sorted(self):
         registry = PolicyRegistry()
         for oid in ["charlie", "alpha", "bravo"]:
             registry.register(PartnerPolicy(org_id=oid, org_name=oid.title()))
         assert registry.list_orgs() == ["alpha", "bravo", "charlie"]
 
+    def test_list_orgs_returns_independent_list(self):
+        registry = PolicyRegistry()
+        registry.register(PartnerPolicy(org_id="alpha", org_name="Alpha"))
+        registry.list_orgs().append("intruder")
+        registry.update(PartnerPolicy(org_id="alpha", org_name="Alpha v2"))
+        assert registry.list_orgs() == ["alpha"]
+
+    def test_detect_keywords_whole_word_case_insensitive(self):
+        registry = PolicyRegistry()
+        registry.register(PartnerPolicy(
+            org_id="org_a",
+            org_name="Org A",
+            escalation_keyword_overrides=["relapse", "self harm"],
+        ))
+        found = registry.detect_keywords(
+            "org_a", "Worried about Self Harm after a RELAPSE; relapsed twice."
+        )
+        assert found == ["self harm", "relapse"]
+
+    def test_detect_keywords_follows_policy_updates(self):
+        registry = PolicyRegistry()
+        registry.register(PartnerPolicy(org_id="org_a", org_name="Org A"))
+        assert registry.detect_keywords("org_a", "overdose") == []
+
+        registry.update(PartnerPolicy(
+            org_id="org_a", org_name="Org A", escalation_keyword_overrides=["overdose"]
+        ))
+        assert registry.detect_keywords("org_a", "overdose") == ["overdose"]
+
+        with pytest.raises(KeyError):
+            registry.detect_keywords("org_b", "overdose")
+
     def test_registry_returns_deep_copies(self):
         """Mutations to retrieved policies must not affect the registry."""
         registry = PolicyRegistry()
@@ -195,6 +340,27 @@ class TestPolicyRegistry:
         original = registry.get("org_a")
         assert original.org_name == "Org A"
 
+    def test_registry_isolates_nested_fields(self):
+        """Nested lists/models are not shared with the caller either way."""
+        registry = PolicyRegistry()
+        policy = PartnerPolicy(
+            org_id="org_a",
+            org_name="Org A",
+            crisis_resource_targets=[
+                CrisisResourceTarget(name="Line", target_type="phone", endpoint="000")
+            ],
+        )
+        registry.register(policy)
+        policy.crisis_resource_targets[0].name = "MUTATED_BEFORE"
+
+        retrieved = registry.get("org_a")
+        retrieved.crisis_resource_targets.clear()
+        retrieved.escalation_thresholds.red_min_distress = 1.0
+
+        original = registry.get("org_a")
+        assert original.crisis_resource_targets[0].name == "Line"
+        assert original.escalation_thresholds.red_min_distress == 8.0
+
 
 # ---------------------------------------------------------------------------
 # 5. YAML round-trip
@@ -229,6 +395,35 @@ class TestYAMLLoader:
         policies = load_policies_from_yaml(path)
         assert len(policies) == 3
 
+    def test_load_nested_structures(self, tmp_path):
+        data = [
+            {
+                "org_id": "nested_org",
+                "org_name": "Nested Org",
+                "escalation_thresholds": {"yellow_min_distress": 3.0},
+                "crisis_resource_targets": [
+                    {"name": "Line", "target_type": "phone", "endpoint": "000"}
+                ],
+            }
+        ]
+        policy = load_policies_from_yaml(self._write_yaml(data, tmp_path))[0]
+        assert policy.escalation_thresholds.yellow_min_distress == 3.0
+        assert isinstance(policy.crisis_resource_targets[0], CrisisResourceTarget)
+
+    def test_load_invalid_nested_thresholds_raises(self, tmp_path):
+        data = [
+            {
+                "org_id": "bad_org",
+                "org_name": "Bad Org",
+                "escalation_thresholds": {
+                    "yellow_min_distress": 6.0,
+                    "orange_min_distress": 5.0,
+                },
+            }
+        ]
+        with pytest.raises(Exception):
+            load_policies_from_yaml(self._write_yaml(data, tmp_path))
+
     def test_load_nonexistent_file_raises(self):
         with pytest.raises(FileNotFoundError):
             load_policies_from_yaml("/nonexistent/path.yaml")
@@ -240,6 +435,26 @@ class TestYAMLLoader:
         with pytest.raises(ValueError, match="top-level 'policies' key"):
             load_policies_from_yaml(path)
 
+    def test_load_multi_document_yaml(self, tmp_path):
+        path = tmp_path / "catalog.yaml"
+        with open(path, "w") as f:
+            yaml.dump_all(
+                [
+                    {"policies": [{"org_id": "org_1", "org_name": "Org 1"}]},
+                    {"policies": [{"org_id": "org_2", "org_name": "Org 2"}]},
+                ],
+                f,
+            )
+        policies = iter_policies_from_yaml(path)
+        assert next(policies).org_id == "org_1"
+        assert [p.org_id for p in policies] == ["org_2"]
+
+    def test_load_empty_file_raises(self, tmp_path):
+        path = tmp_path / "empty.yaml"
+        path.write_text("")
+        with pytest.raises(ValueError, match="top-level 'policies' key"):
+            load_policies_from_yaml(path)
+
     def test_load_sample_partner_policies(self):
         """Validate that the bundled example file loads successfully."""
         sample_path = Path(__file__).parent.parent / "examples" / "partner_policies.yaml"
@@ -44,6 +44,10 @@ class TestCrisisRouter:
         assert results[0].routed is True
         assert "STUB" in results[0].message
 
+        target, routed, _ = results[0]
+        assert target.name == results[0].target.name
+        assert routed is True
+
     def test_route_with_no_targets_logs_event(self):
         audit_log = AuditLog()
         policy = _make_policy(targets=[])
@@ -59,6 +63,17 @@ class TestCrisisRouter:
         assert len(events) == 1
         assert "No crisis resource targets" in events[0].metadata["note"]
 
+    def test_no_target_entries_do_not_share_metadata(self):
+        audit_log = AuditLog()
+        policy = _make_policy(targets=[])
+        route_to_crisis_resources(_make_case(), policy, audit_log)
+        route_to_crisis_resources(_make_case(), policy, audit_log)
+
+        assert audit_log.verify_chain() == (True, None)
+        first, second = audit_log._entries
+        assert first.metadata == second.metadata
+        assert first.metadata is not second.metadata
+
     def test_audit_events_emitted_per_target(self):
         audit_log = AuditLog()
         targets = [
@@ -75,6 +90,8 @@ class TestCrisisRouter:
             event_type=AuditEventType.CRISIS_INTERFACE_TRIGGERED,
         )
         assert len(events) == 2
+        assert [e.metadata["target_name"] for e in events] == ["Target A", "Target B"]
+        assert audit_log.verify_chain() == (True, None)
 
     def test_partner_responsibility_noted_in_audit(self):
         audit_log = AuditLog()
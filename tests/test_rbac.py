@@ -37,3 +37,13 @@ class TestRBAC:
         assert "query_audit" in perms
         assert perms["export_audit"] is True
         assert perms.get("manage_policy") is False
+
+    def test_unknown_action_denied(self):
+        assert check_permission(Role.ADMIN, "delete_everything") is False
+
+    def test_checks_match_permission_table(self):
+        from acuitybridge.rbac import _PERMISSIONS
+
+        for (role, action), allowed in _PERMISSIONS.items():
+            assert check_permission(role, action) is allowed
+            assert get_permissions_for_role(role)[action] is allowed
@@ -6,17 +6,22 @@ import pytest
 
 from acuitybridge.config import EscalationThresholds, PartnerPolicy
 from acuitybridge.models import BiomarkerReading, CheckIn, RiskFlag
-from acuitybridge.signal_evaluator import SignalEvaluationResult, evaluate_check_in
+from acuitybridge.signal_evaluator import (
+    SignalEvaluationResult,
+    evaluate_check_in,
+    evaluate_check_ins,
+)
 
 
 def _make_policy(**kwargs) -> PartnerPolicy:
     return PartnerPolicy(org_id="test_org", org_name="Test Org", **kwargs)
 
 
+_CHECKIN_DEFAULTS = {"participant_id": "p1", "org_id": "test_org"}
+
+
 def _make_checkin(**kwargs) -> CheckIn:
-    defaults = {"participant_id": "p1", "org_id": "test_org"}
-    defaults.update(kwargs)
-    return CheckIn(**defaults)
+    return CheckIn(**{**_CHECKIN_DEFAULTS, **kwargs})
 
 
 class TestSignalEvaluator:
@@ -66,3 +71,75 @@ class TestSignalEvaluator:
         result = evaluate_check_in(check_in, policy, biomarker_readings=[biomarker])
         assert result.flag in (RiskFlag.ORANGE, RiskFlag.RED)
         assert result.requires_human_review()
+
+    def test_lower_signals_do_not_downgrade_flag(self):
+        policy = _make_policy()
+        check_in = _make_checkin(distress_level=9.0, mood_score=1.0, sleep_quality=1.0)
+        sleep = BiomarkerReading(
+            participant_id="p1",
+            org_id="test_org",
+            metric_name="sleep_hours",
+            value=2.0,
+            unit="hours",
+        )
+        result = evaluate_check_in(check_in, policy, biomarker_readings=[sleep])
+        assert result.flag == RiskFlag.RED
+        assert len(result.reasons) == 4
+
+    def test_biomarker_rules(self):
+        policy = _make_policy()
+        check_in = _make_checkin(distress_level=0.0)
+        readings = [
+            BiomarkerReading(
+                participant_id="p1", org_id="test_org",
+                metric_name="sleep_hours", value=2.5, unit="hours",
+            ),
+            BiomarkerReading(
+                participant_id="p1", org_id="test_org",
+                metric_name="resting_heart_rate", value=1.0, unit="bpm",
+            ),
+        ]
+        result = evaluate_check_in(check_in, policy, biomarker_readings=readings)
+        assert result.flag == RiskFlag.ORANGE
+        assert result.reasons == [
+            "Very low sleep (2.5 hours). Supplementary signal elevated for human review.",
+        ]
+
+    def test_reason_text(self):
+        policy = _make_policy(escalation_keyword_overrides=["overdose"])
+        check_in = _make_checkin(
+            distress_level=5.0, mood_score=2.0, keyword_flags=["overdose"]
+        )
+        hrv = BiomarkerReading(
+            participant_id="p1",
+            org_id="test_org",
+            metric_name="heart_rate_variability",
+            value=15.0,
+            unit="ms",
+        )
+        result = evaluate_check_in(check_in, policy, biomarker_readings=[hrv])
+        assert result.reasons == [
+            "Distress level (5.0) >= YELLOW threshold (4.0). Human review required.",
+            "Mood score (2.0) <= low mood threshold (3.0). Elevated for human review.",
+            "Escalation keywords detected: ['overdose']. "
+            "Immediate human review required per partner policy.",
+            "Low HRV reading (15.0 ms). Supplementary signal elevated for human review.",
+        ]
+        assert result.reasons is result.reasons
+
+    def test_result_built_from_text_reasons(self):
+        result = SignalEvaluationResult(flag=RiskFlag.GREEN, reasons=["ok"])
+        assert result.reasons == ["ok"]
+        assert not result.requires_human_review()
+
+    def test_batch_matches_single_evaluation(self):
+        policy = _make_policy(escalation_keyword_overrides=["relapse"])
+        check_ins = [
+            _make_checkin(distress_level=1.0),
+            _make_checkin(distress_level=6.5, sleep_quality=2.0),
+            _make_checkin(mood_score=5.0, keyword_flags=["relapse"]),
+        ]
+        batch = evaluate_check_ins(check_ins, policy)
+        single = [evaluate_check_in(c, policy) for c in check_ins]
+        assert [r.flag for r in batch] == [RiskFlag.GREEN, RiskFlag.ORANGE, RiskFlag.RED]
+        assert [(r.flag, r.reasons) for r in batch] == [(r.flag, r.reasons) for r in single]
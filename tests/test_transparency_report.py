@@ -4,7 +4,10 @@ Tests for acuitybridge.transparency_report -- Decision Transparency Reports.
 
 from acuitybridge.escalation import EscalationCase
 from acuitybridge.models import EscalationState, RiskFlag
-from acuitybridge.transparency_report import generate_transparency_report
+from acuitybridge.transparency_report import (
+    generate_transparency_report,
+    generate_transparency_reports,
+)
 
 
 def _make_case(**kwargs) -> EscalationCase:
@@ -23,11 +26,20 @@ class TestTransparencyReport:
         case = _make_case()
         report = generate_transparency_report(case)
         d = report.to_dict()
-        assert d["case_id"] == case.case_id
-        assert d["participant_id"] == "p1"
-        assert d["flag_level"] == "RED"
+        expected = {
+            "report_type": "Decision Transparency Report",
+            "case_id": case.case_id,
+            "participant_id": "p1",
+            "org_id": "org_a",
+            "flag_level": "RED",
+            "current_state": "DETECTED",
+            "triggering_indicators": ["high_distress", "keyword_match"],
+            "reasoning_chain": [
+                "Flag level RED triggered by indicators: high_distress, keyword_match"
+            ],
+        }
+        assert {key: d[key] for key in expected} == expected
         assert "disclaimer" in d
-        assert len(d["triggering_indicators"]) == 2
 
     def test_report_includes_timeline(self):
         case = _make_case()
@@ -46,3 +58,35 @@ class TestTransparencyReport:
         report = generate_transparency_report(case)
         d = report.to_dict()
         assert "not constitute" in d["disclaimer"].lower()
+
+    def test_timeline_descriptions_for_full_lifecycle(self):
+        from datetime import datetime, timezone
+
+        now = datetime.now(timezone.utc)
+        case = _make_case(
+            assigned_clinician_id="dr_x",
+            alert_sent_at=now,
+            clinician_notified_at=now,
+            acknowledged_at=now,
+            resolved_at=now,
+            resolution_notes="Follow-up {booked}.",
+        )
+        report = generate_transparency_report(case)
+        assert [e["state"] for e in report.timeline] == [
+            "DETECTED", "ALERT_SENT", "CLINICIAN_NOTIFIED", "ACKNOWLEDGED", "RESOLVED",
+        ]
+        assert report.timeline[2]["description"] == "Clinician dr_x notified."
+        assert report.timeline[3]["description"] == "Acknowledged by clinician dr_x."
+        assert report.timeline[4]["description"] == "Resolved. Notes: Follow-up {booked}."
+
+    def test_explicit_generated_at(self):
+        report = generate_transparency_report(
+            _make_case(), generated_at="2026-01-01T00:00:00+00:00",
+        )
+        assert report.generated_at == "2026-01-01T00:00:00+00:00"
+
+    def test_batch_reports_share_generated_at(self):
+        cases = [_make_case(participant_id="p1"), _make_case(participant_id="p2")]
+        reports = generate_transparency_reports(cases)
+        assert [r.participant_id for r in reports] == ["p1", "p2"]
+        assert reports[0].generated_at == reports[1].generated_at